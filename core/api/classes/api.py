@@ -7,6 +7,7 @@ from __future__ import annotations
 import asyncio
 import posixpath
 
+from functools import lru_cache
 from multiprocessing import Manager
 from types import TracebackType
 from typing import Any, Awaitable, Callable, TYPE_CHECKING
@@ -141,14 +142,8 @@ class API:
     def construct_url(self, *path: str, base_url: str | None = None) -> str:
         """Constructs a URL from the base URL and endpoint"""
 
-        # Get base URL
-        base_url = base_url or self.base_url
-
-        # Construct URL
-        url = posixpath.join(base_url, *path)
-
-        # Return URL
-        return url
+        # Construct and return URL
+        return _join_url(base_url or self.base_url, path)
 
     # ┌─────────────────────────────────────────────────────────────────────────────────
     # │ GET
@@ -430,3 +425,16 @@ class API:
 
             # Set response cache to None
             self.api._cached_responses = None
+
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ _JOIN URL
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+
+@lru_cache(maxsize=1024)
+def _join_url(base_url: str, path: tuple[str, ...]) -> str:
+    """Joins a base URL and path segments into a cached URL"""
+
+    # Return joined URL
+    return posixpath.join(base_url, *path)
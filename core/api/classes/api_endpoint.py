@@ -11,6 +11,7 @@ from typing import Any, AsyncGenerator, Generator, TYPE_CHECKING, TypeVar
 # └─────────────────────────────────────────────────────────────────────────────────────
 
 from core.client.exceptions import HTTPStatusCodeError
+from core.client.enums.http_method import HTTP_METHOD_BY_VALUE
 from core.client.types import HTTPMethod
 from core.dict.functions.dfrom_schema import dfrom_schema
 from core.placeholders import nothing
@@ -36,6 +37,66 @@ T = TypeVar("T")
 class APIEndpoint:
     """An API endpoint utility class"""
 
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ CLASS ATTRIBUTES
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    # Define slots
+    __slots__ = (
+        "api",
+        "path",
+        "method",
+        "base_url",
+        "json",
+        "json_path",
+        "json_filter",
+        "json_schema",
+        "params",
+        "params_schema",
+        "weight",
+        "authenticate",
+    )
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ INSTANCE ATTRIBUTES
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    # Declare type of API
+    api: API
+
+    # Declare type of path
+    path: str
+
+    # Declare type of method
+    method: HTTPMethod | None
+
+    # Declare type of base URL
+    base_url: str | None
+
+    # Declare type of JSON
+    json: dict[str, Any] | None
+
+    # Declare type of JSON path
+    json_path: str | None
+
+    # Declare type of JSON filter
+    json_filter: JSONFilter | None
+
+    # Declare type of JSON schema
+    json_schema: JSONSchema | None
+
+    # Declare type of params
+    params: dict[str, Any] | None
+
+    # Declare type of params schema
+    params_schema: dict[str, str] | None
+
+    # Declare type of weight
+    weight: int
+
+    # Declare type of authenticate
+    authenticate: bool
+
     # ┌─────────────────────────────────────────────────────────────────────────────────
     # │ __INIT__
     # └─────────────────────────────────────────────────────────────────────────────────
@@ -63,10 +124,10 @@ class APIEndpoint:
         # Set path
         self.path = path
 
-        # Check if method is a string
-        if isinstance(method, str):
+        # Check if method is a plain string
+        if isinstance(method, str) and not isinstance(method, HTTPMethod):
             # Convert to HTTPMethod
-            method = HTTPMethod[method.upper()]
+            method = HTTP_METHOD_BY_VALUE[method.upper()]
 
         # Set method
         self.method = method
@@ -124,12 +124,11 @@ class APIMixin:
             authenticate_request=getattr(self, "authenticate_request", None),
         )
 
+        # Get API attributes in a single pass, including instance overrides
+        api_attrs = [attr for attr in dir(self) if attr.startswith("API_")]
+
         # Get endpoint attributes
-        endpoint_attrs = [
-            attr
-            for attr in dir(self)
-            if attr.startswith("API_") and attr.endswith("_ENDPOINT")
-        ]
+        endpoint_attrs = [attr for attr in api_attrs if attr.endswith("_ENDPOINT")]
 
         # Iterate over endpoint attributes
         for endpoint_attr in endpoint_attrs:
@@ -155,14 +154,10 @@ class APIMixin:
             # Set endpoint
             setattr(self._api, endpoint_attr.lower()[4:], endpoint)
 
-        # Get endpoint attributes
-        endpoint_attrs = [
-            attr
-            for attr in dir(self)
-            if attr.startswith("API_") and attr.endswith("_ENDPOINTS")
-        ]
+        # Get endpoint collection attributes
+        endpoint_attrs = [attr for attr in api_attrs if attr.endswith("_ENDPOINTS")]
 
-        # Iterate over endpoint attributes
+        # Iterate over endpoint collection attributes
         for endpoint_attr in endpoint_attrs:
             # Initialize endpoint collection
             endpoint_collection = APIEndpointCollection()
@@ -207,11 +202,7 @@ class APIMixin:
         # └─────────────────────────────────────────────────────────────────────────────
 
         # Get channel attributes
-        channel_attrs = [
-            attr
-            for attr in dir(self)
-            if attr.startswith("API_") and attr.endswith("_CHANNEL")
-        ]
+        channel_attrs = [attr for attr in api_attrs if attr.endswith("_CHANNEL")]
 
         # Iterate over channel attributes
         for channel_attr in channel_attrs:
@@ -6,10 +6,10 @@ from __future__ import annotations
 
 import time
 
-from contextlib import nullcontext
+from contextlib import AbstractContextManager, nullcontext
 from multiprocessing import Manager
 from multiprocessing.managers import DictProxy, SyncManager
-from typing import Literal, TYPE_CHECKING
+from typing import Any, Literal, TYPE_CHECKING
 from typing_extensions import TypedDict
 
 # ┌─────────────────────────────────────────────────────────────────────────────────────
@@ -42,6 +42,12 @@ class HTTPClientSession:
     # │ INSTANCE ATTRIBUTES
     # └─────────────────────────────────────────────────────────────────────────────────
 
+    # Declare type of manager
+    _manager: SyncManager | None
+
+    # Declare type of lock
+    _lock: AbstractContextManager[Any] | None
+
     # Declare type of usage
     _usage: (
         DictProxy[Literal["wt"] | Literal["ts"], int | float]
@@ -118,13 +124,20 @@ class HTTPClientSession:
 
         # Initialize lock
         with self._lock if self._lock is not None else nullcontext():
-            # Get URL dict
-            url_dict = self._requests.setdefault(request.url, {})
+            # Get URL dict, initializing it only if missing
+            url_dict = self._requests.get(request.url) or {}
 
             # Get method dict
-            method_dict = url_dict.setdefault(
-                method_key, {"reqs": {}, "rets": {}, "errs": {}}
-            )
+            method_dict = url_dict.get(method_key)
+
+            # Check if method dict is None
+            if method_dict is None:
+                # Initialize method dict
+                method_dict = url_dict[method_key] = {
+                    "reqs": {},
+                    "rets": {},
+                    "errs": {},
+                }
 
             # Get reqs dict
             reqs_dict = method_dict["reqs"]
@@ -148,8 +161,16 @@ class HTTPClientSession:
                 # Get errs dict
                 errs_dict = method_dict["errs"]
 
+                # Get error messages
+                errs = errs_dict.get(status_code)
+
+                # Check if error messages is None
+                if errs is None:
+                    # Initialize error messages
+                    errs = errs_dict[status_code] = set()
+
                 # Add error message
-                errs_dict.setdefault(status_code, set()).add(response.text_stripped)
+                errs.add(response.text_stripped)
 
             # Set URL dict
             self._requests[request.url] = url_dict
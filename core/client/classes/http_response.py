@@ -20,6 +20,7 @@ if TYPE_CHECKING:
 from core.client.types import JSONSchema
 from core.dict.classes.dict_schema_context import DictSchemaContext
 from core.dict.functions.dget import dget
+from core.dict.functions.dcompile_schema import dcompile_schema
 from core.dict.functions.dfrom_schema import dfrom_schema
 
 if TYPE_CHECKING:
@@ -235,24 +236,42 @@ class HTTPResponse:
         if not isinstance(items, list):
             return
 
-        # Iterate over itmes
+        # Check if there is no filter or schema
+        if json_filter is None and json_schema is None:
+            # Iterate over items
+            for item in items:
+                # Yield item if item is a dict
+                if isinstance(item, dict):
+                    yield item
+
+            # Return
+            return
+
+        # Compile JSON schema once for all items
+        remap = dcompile_schema(json_schema) if json_schema is not None else None
+
+        # Iterate over items
         for item in items:
             # Continue if item is not a dict
             if not isinstance(item, dict):
                 continue
 
             # Continue if item should be filtered
-            if json_filter and not json_filter(
+            if json_filter is not None and not json_filter(
                 DictSchemaContext(data=response_json, item=item)
             ):
                 continue
 
-            # Yield item
-            yield (
-                dfrom_schema(item, schema=json_schema, delimiter=".")
-                if json_schema is not None
-                else item
-            )
+            # Check if remap is None
+            if remap is None:
+                # Yield item
+                yield item
+
+                # Continue
+                continue
+
+            # Yield item remapped using the compiled JSON schema
+            yield remap(item)
 
     # ┌─────────────────────────────────────────────────────────────────────────────────
     # │ INSTANCE
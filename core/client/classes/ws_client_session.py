@@ -7,7 +7,7 @@ from __future__ import annotations
 import asyncio
 import time
 
-from contextlib import nullcontext
+from contextlib import AbstractContextManager, nullcontext
 from multiprocessing import Manager
 from multiprocessing.managers import SyncManager
 from typing import Any, Awaitable, Callable
@@ -37,6 +37,12 @@ class WSClientSession:
     # │ INSTANCE ATTRIBUTES
     # └─────────────────────────────────────────────────────────────────────────────────
 
+    # Declare type of manager
+    _manager: SyncManager | None
+
+    # Declare type of process lock
+    _plock: AbstractContextManager[Any] | None
+
     # Declare type of connections
     _connections: dict[str, set[WSConnection]]
 
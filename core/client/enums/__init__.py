@@ -3,3 +3,6 @@
 # └─────────────────────────────────────────────────────────────────────────────────────
 
 from core.client.enums.http_method import HTTPMethod as HTTPMethod  # noqa: F401
+from core.client.enums.http_method import (  # noqa: F401
+    HTTP_METHOD_BY_VALUE as HTTP_METHOD_BY_VALUE,
+)
@@ -10,7 +10,7 @@ from enum import Enum
 # └─────────────────────────────────────────────────────────────────────────────────────
 
 
-class HTTPMethod(Enum):
+class HTTPMethod(str, Enum):
     """An HTTP method enum class"""
 
     # Set DELETE
@@ -27,3 +27,13 @@ class HTTPMethod(Enum):
 
     # Set PUT
     PUT = "PUT"
+
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ HTTP METHOD BY VALUE
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+# Define a lookup of HTTP methods by value for converting strings
+HTTP_METHOD_BY_VALUE: dict[str, HTTPMethod] = {
+    method.value: method for method in HTTPMethod
+}
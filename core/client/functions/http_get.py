@@ -23,6 +23,10 @@ except ImportError:
 
 from core.client.classes.http_request import HTTPRequest
 from core.client.classes.http_response import HTTPResponse
+from core.client.functions.http_response_json import (
+    http_response_json,
+    http_response_json_bytes,
+)
 
 
 # ┌─────────────────────────────────────────────────────────────────────────────────────
@@ -50,13 +54,8 @@ def http_get(request: HTTPRequest) -> HTTPResponse:
         timeout=request.timeout,
     )
 
-    # Initialize try-except block
-    try:
-        # Get the response JSON
-        response_json = response.json()
-    except Exception:
-        # Set the response JSON to None
-        response_json = None
+    # Get the response JSON
+    response_json = http_response_json(response)
 
     # Initialize response
     res = HTTPResponse(
@@ -94,14 +93,8 @@ async def http_get_async(request: HTTPRequest) -> HTTPResponse:
             async with session.get(
                 url=request.url, params=request.params
             ) as response_aiohttp:
-                # Initialize try-except block
-                try:
-                    # Get the response JSON
-                    response_json = await response_aiohttp.json()
-
-                except Exception:
-                    # Set the response JSON to None
-                    response_json = None
+                # Get the response JSON from the response body
+                response_json = http_response_json_bytes(await response_aiohttp.read())
 
                 # Initialize response
                 res = HTTPResponse(
@@ -133,14 +126,8 @@ async def http_get_async(request: HTTPRequest) -> HTTPResponse:
             params=request.params,
         )
 
-    # Initialize try-except block
-    try:
-        # Get the response JSON
-        response_json = response_httpx.json()
-
-    except Exception:
-        # Set the response JSON to None
-        response_json = None
+    # Get the response JSON
+    response_json = http_response_json(response_httpx)
 
     # Initialize response
     res = HTTPResponse(
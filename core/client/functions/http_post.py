@@ -23,6 +23,10 @@ except ImportError:
 
 from core.client.classes.http_request import HTTPRequest
 from core.client.classes.http_response import HTTPResponse
+from core.client.functions.http_response_json import (
+    http_response_json,
+    http_response_json_bytes,
+)
 
 
 # ┌─────────────────────────────────────────────────────────────────────────────────────
@@ -52,14 +56,8 @@ def http_post(request: HTTPRequest) -> HTTPResponse:
         json=request.json,
     )
 
-    # Initialize try-except block
-    try:
-        # Get the response JSON
-        response_json = response.json()
-
-    except Exception:
-        # Set the response JSON to None
-        response_json = None
+    # Get the response JSON
+    response_json = http_response_json(response)
 
     # Initialize response
     res = HTTPResponse(
@@ -100,14 +98,8 @@ async def http_post_async(request: HTTPRequest) -> HTTPResponse:
                 data=request.data,
                 json=request.json,
             ) as response_aiohttp:
-                # Initialize try-except block
-                try:
-                    # Get the response JSON
-                    response_json = await response_aiohttp.json()
-
-                except Exception:
-                    # Set the response JSON to None
-                    response_json = None
+                # Get the response JSON from the response body
+                response_json = http_response_json_bytes(await response_aiohttp.read())
 
                 # Initialize response
                 res = HTTPResponse(
@@ -143,14 +135,8 @@ async def http_post_async(request: HTTPRequest) -> HTTPResponse:
             json=request.json,
         )
 
-    # Initialize try-except block
-    try:
-        # Get the response JSON
-        response_json = response_httpx.json()
-
-    except Exception:
-        # Set the response JSON to None
-        response_json = None
+    # Get the response JSON
+    response_json = http_response_json(response_httpx)
 
     # Initialize response
     res = HTTPResponse(
@@ -6,7 +6,7 @@ from __future__ import annotations
 
 import time
 
-from typing import Any, Callable, TYPE_CHECKING
+from typing import Any, Callable, Coroutine, TYPE_CHECKING
 
 # ┌─────────────────────────────────────────────────────────────────────────────────────
 # │ PROJECT IMPORTS
@@ -17,7 +17,7 @@ from core.client.functions.http_get import http_get, http_get_async
 from core.client.functions.http_patch import http_patch, http_patch_async
 from core.client.functions.http_post import http_post, http_post_async
 from core.client.functions.http_put import http_put, http_put_async
-from core.client.enums.http_method import HTTPMethod
+from core.client.enums.http_method import HTTP_METHOD_BY_VALUE, HTTPMethod
 from core.client.classes.http_request import HTTPRequest
 from core.client.exceptions import InvalidHTTPMethodError
 
@@ -26,6 +26,30 @@ if TYPE_CHECKING:
     from core.client.types import HTTPMethodLiteral
     from core.log.classes.logger import Logger
 
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ HTTP REQUEST FUNCTIONS BY METHOD
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+# Define a lookup of sync HTTP request functions by method
+_HTTP_REQUEST_BY_METHOD: dict[HTTPMethod, Callable[..., HTTPResponse]] = {
+    HTTPMethod.DELETE: http_delete,
+    HTTPMethod.GET: http_get,
+    HTTPMethod.PATCH: http_patch,
+    HTTPMethod.POST: http_post,
+    HTTPMethod.PUT: http_put,
+}
+
+# Define a lookup of async HTTP request functions by method
+_HTTP_REQUEST_ASYNC_BY_METHOD: dict[
+    HTTPMethod, Callable[..., Coroutine[Any, Any, HTTPResponse]]
+] = {
+    HTTPMethod.DELETE: http_delete_async,
+    HTTPMethod.GET: http_get_async,
+    HTTPMethod.PATCH: http_patch_async,
+    HTTPMethod.POST: http_post_async,
+    HTTPMethod.PUT: http_put_async,
+}
+
 
 # ┌─────────────────────────────────────────────────────────────────────────────────────
 # │ CONSTRUCT LOG
@@ -147,15 +171,18 @@ def http_request(
 ) -> HTTPResponse:
     """Makes an HTTP request and returns a HTTPResponse instance"""
 
-    # Check if method is a string
-    if isinstance(method, str):
+    # Check if method is a plain string
+    if not isinstance(method, HTTPMethod):
+        # Get HTTP method by value
+        method_by_value = HTTP_METHOD_BY_VALUE.get(method)
+
         # Check if method not in HTTP methods
-        if method not in HTTPMethod.__members__:
+        if method_by_value is None:
             # Raise an InvalidHTTPMethodError exception
             raise InvalidHTTPMethodError(method=method)
 
         # Convert to enum
-        method = HTTPMethod[method]
+        method = method_by_value
 
     # Initialize request
     request = HTTPRequest(
@@ -200,39 +227,20 @@ def http_request(
     # Log request
     log_request(logger=logger, request=request, is_cached=False)
 
-    # Get t0
-    t0 = time.time()
+    # Get HTTP request function by method
+    http_method_request = _HTTP_REQUEST_BY_METHOD.get(method)
 
-    # Check if GET
-    if method == HTTPMethod.GET:
-        # Make a GET request
-        response = http_get(request=request)
-
-    # Otherwise, check if PATCH
-    elif method == HTTPMethod.PATCH:
-        # Make a POST request
-        response = http_patch(request=request)
-
-    # Otherwise, check if POST
-    elif method == HTTPMethod.POST:
-        # Make a POST request
-        response = http_post(request=request)
-
-    # Otherwise, check if PUT
-    elif method == HTTPMethod.PUT:
-        # Make a POST request
-        response = http_put(request=request)
-
-    # Otherwise, check if DELETE
-    elif method == HTTPMethod.DELETE:
-        # Make a DELETE request
-        response = http_delete(request=request)
-
-    # Otherwise, raise an exception
-    else:
+    # Check if HTTP request function is None
+    if http_method_request is None:
         # Raise an InvalidHTTPMethodError exception
         raise InvalidHTTPMethodError(method=method)
 
+    # Get t0
+    t0 = time.time()
+
+    # Make request
+    response = http_method_request(request=request)
+
     # Get t1
     t1 = time.time()
 
@@ -281,15 +289,18 @@ async def http_request_async(
 ) -> HTTPResponse:
     """Makes an HTTP request and returns a HTTPResponse instance"""
 
-    # Check if method is a string
-    if isinstance(method, str):
+    # Check if method is a plain string
+    if not isinstance(method, HTTPMethod):
+        # Get HTTP method by value
+        method_by_value = HTTP_METHOD_BY_VALUE.get(method)
+
         # Check if method not in HTTP methods
-        if method not in HTTPMethod.__members__:
+        if method_by_value is None:
             # Raise an InvalidHTTPMethodError exception
             raise InvalidHTTPMethodError(method=method)
 
         # Convert to enum
-        method = HTTPMethod[method]
+        method = method_by_value
 
     # Initialize request
     request = HTTPRequest(
@@ -334,39 +345,20 @@ async def http_request_async(
     # Log request
     log_request(logger=logger, request=request, is_cached=False)
 
-    # Get t0
-    t0 = time.time()
+    # Get HTTP request function by method
+    http_method_request = _HTTP_REQUEST_ASYNC_BY_METHOD.get(method)
 
-    # Check if GET
-    if method == HTTPMethod.GET:
-        # Make a GET request
-        response = await http_get_async(request=request)
-
-    # Otherwise, check if PATCH
-    elif method == HTTPMethod.PATCH:
-        # Make a POST request
-        response = await http_patch_async(request=request)
-
-    # Otherwise, check if POST
-    elif method == HTTPMethod.POST:
-        # Make a POST request
-        response = await http_post_async(request=request)
-
-    # Otherwise, check if PUT
-    elif method == HTTPMethod.PUT:
-        # Make a POST request
-        response = await http_put_async(request=request)
-
-    # Otherwise, check if DELETE
-    elif method == HTTPMethod.DELETE:
-        # Make a DELETE request
-        response = await http_delete_async(request=request)
-
-    # Otherwise, raise an exception
-    else:
+    # Check if HTTP request function is None
+    if http_method_request is None:
         # Raise an InvalidHTTPMethodError exception
         raise InvalidHTTPMethodError(method=method)
 
+    # Get t0
+    t0 = time.time()
+
+    # Make request
+    response = await http_method_request(request=request)
+
     # Get t1
     t1 = time.time()
 
@@ -0,0 +1,70 @@
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ GENERAL IMPORTS
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+import json
+
+from typing import Any
+
+try:
+    import orjson  # type: ignore[import]
+except ImportError:
+    orjson = None  # type: ignore
+
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ HTTP RESPONSE JSON
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+
+def http_response_json(response: Any) -> Any:
+    """Returns the JSON of an httpx or requests response, or None if invalid"""
+
+    # Check if orjson is not None
+    if orjson is not None:
+        # Initialize try-except block
+        try:
+            # Return JSON parsed from raw content
+            return orjson.loads(response.content)
+
+        # Fall back to the response parser for non-UTF-8 or invalid content
+        except Exception:
+            pass
+
+    # Initialize try-except block
+    try:
+        # Return response JSON
+        return response.json()
+
+    # Return None if response JSON is invalid
+    except Exception:
+        return None
+
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ HTTP RESPONSE JSON BYTES
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+
+def http_response_json_bytes(content: bytes) -> Any:
+    """Returns the JSON of raw response content, or None if invalid"""
+
+    # Check if orjson is not None
+    if orjson is not None:
+        # Initialize try-except block
+        try:
+            # Return JSON parsed from raw content
+            return orjson.loads(content)
+
+        # Fall back to the standard parser for non-UTF-8 or invalid content
+        except Exception:
+            pass
+
+    # Initialize try-except block
+    try:
+        # Return JSON parsed from raw content
+        return json.loads(content)
+
+    # Return None if content JSON is invalid
+    except Exception:
+        return None
@@ -8,6 +8,7 @@ import random
 
 from abc import ABC, abstractmethod
 from copy import deepcopy
+from itertools import islice
 from typing import Any, Callable, Generator, Generic, Hashable, Iterator, TypeVar
 
 # ┌─────────────────────────────────────────────────────────────────────────────────────
@@ -207,25 +208,18 @@ class Collection(Generic[ItemBound], ABC):
     def __reprstr__(self, func: Callable[[ItemBound], str]) -> str:
         """A utility function to be used with __repr__ and __str__"""
 
-        # Get item count
-        item_count = len(self)
+        # Get representations of the first 21 items
+        item_reprs = [func(item) for item in islice(self, 21)]
 
         # Initialize representation
-        representation = f"{self.__class__.__name__}: {item_count} ["
-
-        # Iterate over items
-        for i, item in enumerate(self):
-            # Add item representation to representation
-            representation += func(item)
+        representation = f"{self.__class__.__name__}: {len(self)} ["
 
-            # Check if should truncate
-            if i > 19:
-                representation += " ...(remaining elements truncated)... "
-                break
+        # Add comma-separated item representations to representation
+        representation += ", ".join(item_reprs)
 
-            # Check if should add a comma
-            if i < item_count - 1:
-                representation += ", "
+        # Check if should truncate
+        if len(item_reprs) > 20:
+            representation += " ...(remaining elements truncated)... "
 
         # Close square brackets
         representation += "]"
@@ -444,7 +438,7 @@ class Collection(Generic[ItemBound], ABC):
             return 0
 
         # Check if item is the same
-        if id(item_found) == id(item):
+        if item_found is item:
             return 1
 
         # Update item
@@ -247,12 +247,21 @@ class DictCollection(Collection[ItemBound]):
         if id(item) in self._items_by_id:
             return item
 
+        # Initialize try-except block
+        try:
+            # Get item ID by key
+            item_id = self._item_ids_by_key.get(item)
+
+        # Handle TypeError of unhashable items
+        except TypeError:
+            item_id = None
+
         # Return if item is in item IDs by key
-        if isinstance(item, Hashable) and item in self._item_ids_by_key:
-            return self._items_by_id[self._item_ids_by_key[item]]
+        if item_id is not None:
+            return self._items_by_id[item_id]
 
-        # Check if item has a __dict__ attribute
-        if hasattr(item, "__dict__"):
+        # Check if item has a __dict__ attribute or is an instance of a slotted class
+        if hasattr(item, "__dict__") or hasattr(type(item), "__slots__"):
             # Iterate over keys
             for key in self._keys:
                 # Get value
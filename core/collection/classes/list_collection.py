@@ -130,13 +130,10 @@ class ListCollection(Collection[ItemBound]):
     def find(self, item: Any | ItemBound) -> ItemBound | None:
         """Finds an item in the collection"""
 
-        # Get item ID
-        id_item = id(item)
-
         # Iterate over items
         for current in self:
             # Return item if current is item
-            if id(current) == id_item or current == item:
+            if current is item or current == item:
                 return current
 
         # Return get
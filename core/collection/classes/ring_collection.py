@@ -187,34 +187,41 @@ class RingCollection(Collection[ItemBound]):
     def add(self, *items: ItemBound) -> int:
         """Adds an item to the collection"""
 
-        # Initialize count
-        count = 0
+        # Bind ring state to locals
+        ring = self._ring
+        size = self._size
+        cursor = self._cursor
+        length = self._length
 
         # Iterate over items
         for item in items:
-            # Check if size is None
-            if self._size is None or self._length < self._size:
+            # Check if no size limit or length is less than size
+            if size is None or length < size:
                 # Append item to collection
-                self._ring.append(item)
+                ring.append(item)
+
+                # Increment length
+                length += 1
 
             # Otherwise insert by cursor
             else:
                 # Add item to buffer
-                self._ring[self._cursor] = item
+                ring[cursor] = item
 
             # Increment cursor
-            self._cursor = self._cursor_next
+            cursor += 1
 
-            # Check if no size limit or length is less than size
-            if self._size is None or self._length < self._size:
-                # Increment length
-                self._length += 1
+            # Check if size is not None
+            if size is not None:
+                # Wrap cursor
+                cursor %= size
 
-            # Increment count
-            count += 1
+        # Store ring state
+        self._cursor = cursor
+        self._length = length
 
         # Return count
-        return count
+        return len(items)
 
     # ┌─────────────────────────────────────────────────────────────────────────────────
     # │ FIND
@@ -223,13 +230,10 @@ class RingCollection(Collection[ItemBound]):
     def find(self, item: Any | ItemBound) -> ItemBound | None:
         """Finds an item in the collection"""
 
-        # Get item ID
-        id_item = id(item)
-
         # Iterate over items
         for current in self:
             # Return item if current is item
-            if id(current) == id_item or current == item:
+            if current is item or current == item:
                 return current
 
         # Return get
@@ -128,7 +128,7 @@ def check_in(actual: Any, expected: Any) -> bool:
 
     # Initialize try-except block
     try:
-        return True if actual in expected else False
+        return actual in expected
 
     # Handle TypeError
     except TypeError:
@@ -148,7 +148,7 @@ def check_iin(actual: Any, expected: Any) -> bool:
 
     # Initialize try-except block
     try:
-        return True if actual in expected else False
+        return actual in expected
 
     # Handle TypeError
     except TypeError:
@@ -165,7 +165,7 @@ def check_contains(actual: Any, expected: Any) -> bool:
 
     # Initialize try-except block
     try:
-        return True if expected in actual else False
+        return expected in actual
 
     # Handle TypeError
     except TypeError:
@@ -185,7 +185,7 @@ def check_icontains(actual: Any, expected: Any) -> bool:
 
     # Initialize try-except block
     try:
-        return True if expected in actual else False
+        return expected in actual
 
     # Handle TypeError
     except TypeError:
@@ -2,6 +2,7 @@
 # │ GENERAL IMPORTS
 # └─────────────────────────────────────────────────────────────────────────────────────
 
+from functools import lru_cache
 from typing import Any, Callable, Generator
 
 # ┌─────────────────────────────────────────────────────────────────────────────────────
@@ -58,15 +59,31 @@ def get_filter_condition(
 ) -> tuple[str, Any, str, Callable[[Any, Any], bool]]:
     """Returns a filter condition tuple based on a key and value"""
 
+    # Get parsed key, operator and checker
+    key, operator, checker = _parse_filter_key(key)
+
+    # Return filter condition
+    return (key, value, operator, checker)
+
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ _PARSE FILTER KEY
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+
+@lru_cache(maxsize=1024)
+def _parse_filter_key(key: str) -> tuple[str, str, Callable[[Any, Any], bool]]:
+    """Parses a filter key into a cached key, operator and checker tuple"""
+
     # Iterate over operators
     for operator, char_count, checker in OPERATORS:
         # Check if key ends with operator
         if key.endswith(operator):
-            # Return filter condition
-            return (key[:-char_count], value, "__gte", checker)
+            # Return parsed filter key
+            return (key[:-char_count], "__gte", checker)
 
-    # Return equality condition as default
-    return (key, value, "__eq", check_eq)
+    # Return equality as default
+    return (key, "__eq", check_eq)
 
 
 # ┌─────────────────────────────────────────────────────────────────────────────────────
@@ -2,6 +2,7 @@
 # │ PROJECT IMPORTS
 # └─────────────────────────────────────────────────────────────────────────────────────
 
+from core.dict.functions.dcompile_schema import dcompile_schema as dcompile_schema  # noqa: F401
 from core.dict.functions.dfrom_schema import dfrom_schema as dfrom_schema  # noqa: F401
 from core.dict.functions.dget import dget as dget  # noqa: F401
 from core.dict.functions.dset import dset as dset  # noqa: F401
@@ -0,0 +1,227 @@
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ GENERAL IMPORTS
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+from __future__ import annotations
+
+from functools import lru_cache
+from typing import Any, Callable, TYPE_CHECKING
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ PROJECT IMPORTS
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+from core.dict.functions.dget import dget
+from core.dict.functions.dset import dset
+from core.dict.classes.dict_schema_context import DictSchemaContext
+from core.object.functions.oget import _split_path
+from core.placeholders.classes.nothing import Nothing
+
+if TYPE_CHECKING:
+    from core.dict.types import DictSchema
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ MISSING
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+# Initialize a private missing placeholder
+_MISSING = Nothing()
+
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ DCOMPILE SCHEMA
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+
+def dcompile_schema(
+    schema: DictSchema, delimiter: str = "."
+) -> Callable[..., dict[Any, Any]]:
+    """Compiles a JSON schema into a function that remaps a dictionary"""
+
+    # Get schema items
+    items = tuple(schema.items())
+
+    # Check if every setter and getter is a plain string
+    if all(type(setter) is str and type(getter) is str for setter, getter in items):
+        # Return compiled schema
+        return _compile_schema(items, delimiter)
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ REMAP
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def remap(
+        data: dict[Any, Any], defaults: dict[Any, Any] | None = None
+    ) -> dict[Any, Any]:
+        """Remaps a dictionary using the schema items"""
+
+        # Initialize mapped data from a copy of defaults
+        mapped_data: dict[Any, Any] = dict(defaults) if defaults else {}
+
+        # Initialize context of callable getters
+        context = None
+
+        # Iterate over schema items
+        for setter, getter in items:
+            # Check if getter is callable
+            if callable(getter):
+                # Initialize context if None
+                if context is None:
+                    context = DictSchemaContext(data=data, item=data)
+
+                # Get value to set
+                value_to_set = getter(context)
+
+            # Otherwise handle case of string path
+            else:
+                # Get value to set
+                value_to_set = dget(data, getter, delimiter=delimiter)
+
+            # Set value to set to mapped data
+            dset(mapped_data, setter, value_to_set, delimiter=delimiter, insert=True)
+
+        # Return mapped data
+        return mapped_data
+
+    # Return remap function
+    return remap
+
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ _COMPILE SCHEMA
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+
+@lru_cache(maxsize=256)
+def _compile_schema(
+    items: tuple[tuple[str, str], ...], delimiter: str
+) -> Callable[..., dict[Any, Any]]:
+    """Compiles string schema items into a generated remap function"""
+
+    # Initialize namespace of generated function
+    namespace: dict[str, Any] = {
+        "_MISSING": _MISSING,
+        "delimiter": delimiter,
+        "dget": dget,
+        "dset": dset,
+    }
+
+    # Initialize lines of generated function
+    lines = ["def remap(data, defaults=None):"]
+
+    # Check if every setter and getter is a single key
+    if all(
+        delimiter not in setter and delimiter not in getter for setter, getter in items
+    ):
+        # Get dict display of setters and getter subscripts
+        display = ", ".join(f"{setter!r}: data[{getter!r}]" for setter, getter in items)
+
+        # Add lines that return a dict display of a plain dictionary without defaults,
+        # falling back to the lines below on a missing key
+        lines.extend(
+            [
+                "    if not defaults and type(data) is dict:",
+                "        try:",
+                f"            return {{{display}}}",
+                "        except KeyError:",
+                "            pass",
+            ]
+        )
+
+    # Add line that initializes mapped data from a copy of defaults
+    lines.append("    mapped_data = dict(defaults) if defaults else {}")
+
+    # Iterate over schema items
+    for i, (setter, getter) in enumerate(items):
+        # Add setter and getter to namespace
+        namespace[f"setter_{i}"] = setter
+        namespace[f"getter_{i}"] = getter
+
+        # Add getter lines
+        lines.extend(_compile_getter_lines(i, getter, delimiter))
+
+        # Add setter lines
+        lines.extend(_compile_setter_lines(i, setter, delimiter))
+
+    # Return mapped data
+    lines.append("    return mapped_data")
+
+    # Execute generated function source
+    exec(compile("\n".join(lines), "<dcompile_schema>", "exec"), namespace)
+
+    # Return generated function
+    return namespace["remap"]  # type: ignore[no-any-return]
+
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ _COMPILE GETTER LINES
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+
+def _compile_getter_lines(i: int, getter: str, delimiter: str) -> list[str]:
+    """Compiles a string schema getter into lines that assign value"""
+
+    # Get first key and remaining keys
+    key_first, *keys = _split_path(getter, delimiter)
+
+    # Initialize lines with a lookup of the first key in a plain dictionary
+    lines = [
+        f"    value = data.get({key_first!r}, _MISSING) "
+        "if type(data) is dict else _MISSING"
+    ]
+
+    # Add lookups of the remaining keys in plain dictionaries
+    lines.extend(
+        f"    value = value.get({key!r}, _MISSING) "
+        "if type(value) is dict else _MISSING"
+        for key in keys
+    )
+
+    # Return lookup lines, falling back to dget for other values and misses
+    return lines + [
+        "    if value is _MISSING:",
+        f"        value = dget(data, getter_{i}, delimiter=delimiter)",
+    ]
+
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ _COMPILE SETTER LINES
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+
+def _compile_setter_lines(i: int, setter: str, delimiter: str) -> list[str]:
+    """Compiles a string schema setter into lines that place value"""
+
+    # Initialize dset line
+    line_dset = (
+        f"dset(mapped_data, setter_{i}, value, delimiter=delimiter, insert=True)"
+    )
+
+    # Get leading keys and last key
+    *keys, key_last = _split_path(setter, delimiter)
+
+    # Check if setter is a single key
+    if not keys:
+        # Return single key lines
+        return [f"    mapped_data[{key_last!r}] = value"]
+
+    # Get first leading key and remaining leading keys
+    key_first, *keys = keys
+
+    # Initialize lines with an insert of the first leading key
+    lines = [f"    node = mapped_data.setdefault({key_first!r}, {{}})"]
+
+    # Add inserts of the remaining leading keys into plain dictionaries
+    lines.extend(
+        f"    node = node.setdefault({key!r}, {{}}) "
+        "if type(node) is dict else _MISSING"
+        for key in keys
+    )
+
+    # Return insert lines, falling back to dset for other values
+    return lines + [
+        "    if type(node) is dict:",
+        f"        node[{key_last!r}] = value",
+        "    else:",
+        f"        {line_dset}",
+    ]
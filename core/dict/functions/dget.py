@@ -8,7 +8,7 @@ from typing import Any
 # │ PROJECT IMPORTS
 # └─────────────────────────────────────────────────────────────────────────────────────
 
-from core.object.functions.oget import oget
+from core.object.functions.oget import _MISSING, oget
 from core.placeholders import nothing
 
 
@@ -25,5 +25,14 @@ def dget(
 ) -> Any:
     """Gets a value from a nested dictionary using a path string"""
 
+    # Check if path is a single key of a dictionary
+    if delimiter not in path and isinstance(dictionary, dict):
+        # Get value by key
+        value = dictionary.get(path, _MISSING)
+
+        # Return value if key exists
+        if value is not _MISSING:
+            return value
+
     # Return value
     return oget(dictionary, path=path, default=default, delimiter=delimiter)
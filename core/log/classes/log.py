@@ -2,7 +2,7 @@
 # │ GENERAL IMPORTS
 # └─────────────────────────────────────────────────────────────────────────────────────
 
-from datetime import datetime
+from datetime import datetime, timezone
 
 # ┌─────────────────────────────────────────────────────────────────────────────────────
 # │ PROJECT IMPORTS
@@ -20,6 +20,32 @@ from core.datetime.functions.dtto_utc import dtto_utc
 class Log:
     """A log utility class"""
 
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ CLASS ATTRIBUTES
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    # Define slots
+    __slots__ = ("key", "timestamp", "message", "level", "exception")
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ INSTANCE ATTRIBUTES
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    # Declare type of key
+    key: str | None
+
+    # Declare type of timestamp
+    timestamp: datetime
+
+    # Declare type of message
+    message: str
+
+    # Declare type of level
+    level: int
+
+    # Declare type of exception
+    exception: Exception | None
+
     # ┌─────────────────────────────────────────────────────────────────────────────────
     # │ __INIT__
     # └─────────────────────────────────────────────────────────────────────────────────
@@ -42,9 +68,9 @@ class Log:
             # Get timestamp
             timestamp = dtnow_utc()
 
-        # Otherwise handle existing
-        else:
-            # Ensure datetime is in UTC
+        # Otherwise ensure existing timestamp is in UTC
+        elif timestamp.tzinfo is not timezone.utc:
+            # Convert timestamp to UTC
             timestamp = dtto_utc(timestamp)
 
         # Set timestamp
@@ -3,6 +3,13 @@
 # └─────────────────────────────────────────────────────────────────────────────────────
 
 import logging
+import sys
+import threading
+import time
+import weakref
+
+from datetime import datetime
+from typing import Any, Callable, TextIO
 
 # ┌─────────────────────────────────────────────────────────────────────────────────────
 # │ PROJECT IMPORTS
@@ -11,7 +18,56 @@ import logging
 from core.datetime.functions.dtnow import dtnow_utc
 from core.log.classes.log import Log
 from core.log.classes.log_collection import LogCollection
-from core.log.exceptions import InvalidLogLevelError
+from core.log.exceptions import InvalidLogFormatError, InvalidLogLevelError
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ VALID LEVELS
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+# Initialize valid log levels
+_VALID_LEVELS = frozenset(logging._levelToName)
+
+# Initialize right-aligned level names
+_LEVEL_NAMES = {level: f"{name:>7}" for level, name in logging._levelToName.items()}
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ LOG FORMAT DEFAULT
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+# Initialize default log format
+_LOG_FORMAT_DEFAULT = "%(asctime)s | %(levelname)7s | %(name)s | %(message)s"
+
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ _FAST DEFAULT FORMATTER
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+
+class _FastDefaultFormatter(logging.Formatter):
+    """A formatter that renders the default log format without template parsing"""
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ __INIT__
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def __init__(self) -> None:
+        """Init Method"""
+
+        # Initialize formatter with default log format
+        super().__init__(_LOG_FORMAT_DEFAULT)
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ FORMAT MESSAGE
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def formatMessage(self, record: logging.LogRecord) -> str:
+        """Formats a log record message using the default log format"""
+
+        # Return formatted message
+        return (
+            f"{record.asctime} | {record.levelname:>7} | {record.name} | "
+            f"{record.message}"
+        )
 
 
 # ┌─────────────────────────────────────────────────────────────────────────────────────
@@ -38,9 +94,27 @@ class Logger:
     # Declare type of log limit
     log_limit: int | None
 
+    # Declare type of fast
+    fast: bool
+
+    # Declare type of fast streams
+    _fast_streams: list[tuple[int, TextIO]]
+
+    # Declare type of fast files
+    _fast_files: list[TextIO]
+
+    # Declare type of fast lock
+    _fast_lock: threading.Lock
+
     # Declare type of logs by key
     _logs_by_key: dict[str | None, LogCollection]
 
+    # Declare type of log add functions by key
+    _log_adds_by_key: dict[str | None, Callable[..., int]]
+
+    # Declare type of log functions by level
+    _log_funcs_by_level: dict[int, Callable[..., Any]]
+
     # ┌─────────────────────────────────────────────────────────────────────────────────
     # │ __INIT__
     # └─────────────────────────────────────────────────────────────────────────────────
@@ -51,14 +125,20 @@ class Logger:
         log_level: int | None = None,
         log_format: str | None = None,
         log_limit: int | None = None,
+        fast: bool = False,
     ) -> None:
         """Init Method"""
 
         # Check if log level is invalid
-        if log_level is not None and log_level not in logging._levelToName:
+        if log_level is not None and log_level not in _VALID_LEVELS:
             # Raise InvaidLogLevelError
             raise InvalidLogLevelError(log_level)
 
+        # Check if log format is passed to a fast logger
+        if fast and log_format is not None:
+            # Raise InvalidLogFormatError
+            raise InvalidLogFormatError(log_format)
+
         # Set key
         self.key = key
 
@@ -66,9 +146,7 @@ class Logger:
         self.log_level = log_level
 
         # Get log format
-        log_format = (
-            log_format or "%(asctime)s | %(levelname)7s | %(name)s | %(message)s"
-        )
+        log_format = log_format or _LOG_FORMAT_DEFAULT
 
         # Set log format
         self.log_format = log_format
@@ -76,12 +154,50 @@ class Logger:
         # Set log limit
         self.log_limit = log_limit
 
+        # Set fast
+        self.fast = fast
+
         # Initialize and set logger
         self._logger = logging.getLogger(key)
 
         # Disable logger propogation to root logger
         self._logger.propagate = False
 
+        # Initialize fast streams
+        self._fast_streams = []
+
+        # Initialize fast files
+        self._fast_files = []
+
+        # Initialize fast lock
+        self._fast_lock = threading.Lock()
+
+        # Initialize logs by key
+        self._logs_by_key = {}
+
+        # Initialize log add functions by key
+        self._log_adds_by_key = {}
+
+        # Initialize log functions by level
+        self._log_funcs_by_level = {
+            logging.DEBUG: self._logger.debug,
+            logging.INFO: self._logger.info,
+            logging.WARNING: self._logger.warning,
+            logging.ERROR: self._logger.error,
+            logging.CRITICAL: self._logger.critical,
+        }
+
+        # Check if fast
+        if fast:
+            # Close fast files when the logger is garbage collected
+            weakref.finalize(self, _close_files, self._fast_files)
+
+            # Add stderr to fast streams
+            self._fast_streams.append((log_level or logging.NOTSET, sys.stderr))
+
+            # Return early to skip the stdlib handler
+            return
+
         # Initialize handler
         handler = logging.StreamHandler()
 
@@ -91,14 +207,11 @@ class Logger:
             handler.setLevel(log_level)
 
         # Initialize and add formatter
-        handler.setFormatter(logging.Formatter(log_format))
+        handler.setFormatter(_make_formatter(log_format))
 
         # Add handler to logger
         self._logger.addHandler(handler)
 
-        # Initialize logs by key
-        self._logs_by_key = {}
-
     # ┌─────────────────────────────────────────────────────────────────────────────────
     # │ ADD LOG FILE
     # └─────────────────────────────────────────────────────────────────────────────────
@@ -111,12 +224,31 @@ class Logger:
     ) -> None:
         """Adds a log file to the logger"""
 
-        # Initialize handler
-        handler = logging.FileHandler(file_path)
-
         # Get log level
         log_level = log_level if log_level is not None else self.log_level
 
+        # Check if fast
+        if self.fast:
+            # Check if log format is passed
+            if log_format is not None:
+                # Raise InvalidLogFormatError
+                raise InvalidLogFormatError(log_format)
+
+            # Open log file
+            file = open(file_path, "a", encoding="utf-8")
+
+            # Add log file to fast files
+            self._fast_files.append(file)
+
+            # Add log file to fast streams
+            self._fast_streams.append((log_level or logging.NOTSET, file))
+
+            # Return early to skip the stdlib handler
+            return
+
+        # Initialize handler
+        handler = logging.FileHandler(file_path)
+
         # Check if log log level is not None
         if log_level is not None:
             # Set log log level
@@ -128,11 +260,30 @@ class Logger:
         # Check if log format is not None
         if log_format is not None:
             # Initialize and add formatter
-            handler.setFormatter(logging.Formatter(log_format))
+            handler.setFormatter(_make_formatter(log_format))
 
         # Set log file handler
         self._logger.addHandler(handler)
 
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ CLOSE
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def close(self) -> None:
+        """Closes the log files opened by the logger"""
+
+        # Acquire fast lock
+        with self._fast_lock:
+            # Remove fast files from fast streams
+            self._fast_streams[:] = [
+                (stream_level, stream)
+                for stream_level, stream in self._fast_streams
+                if stream not in self._fast_files
+            ]
+
+            # Close fast files
+            _close_files(self._fast_files)
+
     # ┌─────────────────────────────────────────────────────────────────────────────────
     # │ CRITICAL
     # └─────────────────────────────────────────────────────────────────────────────────
@@ -200,29 +351,25 @@ class Logger:
     ) -> bool:
         """Prints and stores a log message"""
 
-        # Define log functions
-        log_funcs = {
-            logging.DEBUG: self._logger.debug,
-            logging.INFO: self._logger.info,
-            logging.WARN: self._logger.warn,
-            logging.WARNING: self._logger.warning,
-            logging.ERROR: self._logger.error,
-            logging.CRITICAL: self._logger.critical,
-        }
+        # Get log function
+        log_func = self._log_funcs_by_level.get(level)
 
         # Check if log level is invalid
-        if level not in log_funcs:
+        if log_func is None:
             # Raise InvaidLogLevelError
             raise InvalidLogLevelError(level)
 
-        # Get log function
-        log_func = log_funcs[level]
-
         # Get timestamp
         timestamp = dtnow_utc()
 
-        # Log message
-        log_func(message)
+        # Check if fast
+        if self.fast:
+            # Write message to fast streams
+            self._write_fast(message=message, level=level, timestamp=timestamp)
+
+        # Otherwise log message using the stdlib logger
+        else:
+            log_func(message)
 
         # Initialize Log instance
         log = Log(
@@ -233,11 +380,19 @@ class Logger:
             exception=exception,
         )
 
-        # Get logs
-        logs = self._logs_by_key.setdefault(key, LogCollection(size=self.log_limit))
+        # Get log add function
+        log_add = self._log_adds_by_key.get(key)
+
+        # Check if log add function is None
+        if log_add is None:
+            # Initialize and set logs
+            logs = self._logs_by_key[key] = LogCollection(size=self.log_limit)
+
+            # Set log add function
+            log_add = self._log_adds_by_key[key] = logs.add
 
         # Add log to logs
-        logs.add(log)
+        log_add(log)
 
         # Return True
         return True
@@ -256,7 +411,44 @@ class Logger:
 
         # Otherwise create new log collection
         else:
-            self._logs_by_key[key] = LogCollection(size=limit)
+            # Initialize and set logs
+            logs = self._logs_by_key[key] = LogCollection(size=limit)
+
+            # Set log add function
+            self._log_adds_by_key[key] = logs.add
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ _WRITE FAST
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def _write_fast(self, message: str, level: int, timestamp: datetime) -> None:
+        """Writes a log line directly to the fast streams"""
+
+        # Return if level is not enabled on the stdlib logger
+        if not self._logger.isEnabledFor(level):
+            return
+
+        # Get created time
+        created = timestamp.timestamp()
+
+        # Get local time formatted like the default asctime
+        asctime = time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(created))
+
+        # Get log line
+        line = (
+            f"{asctime},{int((created - int(created)) * 1000):03d} | "
+            f"{_LEVEL_NAMES[level]} | {self._logger.name} | {message}\n"
+        )
+
+        # Acquire fast lock
+        with self._fast_lock:
+            # Iterate over fast streams
+            for stream_level, stream in self._fast_streams:
+                # Check if level is enabled for stream
+                if level >= stream_level:
+                    # Write and flush log line
+                    stream.write(line)
+                    stream.flush()
 
     # ┌─────────────────────────────────────────────────────────────────────────────────
     # │ WARN
@@ -277,3 +469,37 @@ class Logger:
 
         # Log message
         return self.log(message=message, level=logging.WARNING, key=key)
+
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ _MAKE FORMATTER
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+
+def _make_formatter(log_format: str) -> logging.Formatter:
+    """Returns a formatter for a log format, using a fast path for the default"""
+
+    # Check if log format is the default
+    if log_format == _LOG_FORMAT_DEFAULT:
+        # Return fast default formatter
+        return _FastDefaultFormatter()
+
+    # Return generic formatter
+    return logging.Formatter(log_format)
+
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ _CLOSE FILES
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+
+def _close_files(files: list[TextIO]) -> None:
+    """Closes and removes a list of open files"""
+
+    # Iterate over files
+    for file in files:
+        # Close file
+        file.close()
+
+    # Clear files
+    files.clear()
@@ -18,3 +18,25 @@ class InvalidLogLevelError(Exception):
 
         # Set the level
         self.level = level
+
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ INVALID LOG FORMAT ERROR
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+
+class InvalidLogFormatError(Exception):
+    """Raised when a log format is passed to a fast logger"""
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ __INIT__
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def __init__(self, log_format: str) -> None:
+        """Init Method"""
+
+        # Initialize the exception
+        super().__init__(f"Log formats are not supported in fast mode: {log_format}")
+
+        # Set the log format
+        self.log_format = log_format
@@ -2,7 +2,7 @@
 # │ GENERAL IMPORTS
 # └─────────────────────────────────────────────────────────────────────────────────────
 
-from typing import Any, TypeVar
+from typing import Any, TypeVar, cast
 
 try:
     from beartype.door import is_bearable
@@ -24,13 +24,14 @@ T = TypeVar("T")
 def assert_isinstance(obj: T, obj_type: Any, name: str | None = None) -> T:
     """Raises a TypeError if object is not an instance of a type"""
 
-    # Initialize is instance
-    is_instance = False
-
     # Initialize try-except block
     try:
-        # Check if is instance
-        is_instance = isinstance(obj, obj_type)
+        # Return object as its declared type if is instance
+        if isinstance(obj, obj_type):
+            return cast(T, obj)
+
+        # Set is instance to False
+        is_instance = False
 
     # Handle TypeError
     except TypeError:
@@ -43,7 +44,7 @@ def assert_isinstance(obj: T, obj_type: Any, name: str | None = None) -> T:
         is_instance = is_bearable(obj, obj_type)
 
     # Check if is instance is False
-    if is_instance is False:
+    if not is_instance:
         # Raise a TypeError
         raise TypeError(
             f"{name + ': ' if name is not None else ''}"
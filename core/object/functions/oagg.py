@@ -2,7 +2,8 @@
 # │ GENERAL IMPORTS
 # └─────────────────────────────────────────────────────────────────────────────────────
 
-from typing import Any, Iterable, TypeVar
+from functools import lru_cache
+from typing import Any, Callable, Iterable, TypeVar
 
 # ┌─────────────────────────────────────────────────────────────────────────────────────
 # │ PROJECT IMPORTS
@@ -18,6 +19,121 @@ from core.object.functions.oget import oget
 T = TypeVar("T")
 
 
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ _FIRST
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+
+def _first(values: Iterable[Any]) -> Any:
+    """Returns the first of an iterable of values, or None if empty"""
+
+    # Return first value
+    return next(iter(values), None)
+
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ _MIN
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+
+def _min(values: Iterable[Any]) -> Any:
+    """Returns the min of an iterable of values, or None if empty"""
+
+    # Return min value
+    return min(values, default=None)
+
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ _MAX
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+
+def _max(values: Iterable[Any]) -> Any:
+    """Returns the max of an iterable of values, or None if empty"""
+
+    # Return max value
+    return max(values, default=None)
+
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ _ANY
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+
+def _any(values: Iterable[Any]) -> bool | None:
+    """Returns whether any value is truthy, or None if empty"""
+
+    # Initialize result
+    result = None
+
+    # Iterate over values
+    for value in values:
+        # Return True if value is truthy
+        if value:
+            return True
+
+        # Set result to False
+        result = False
+
+    # Return result
+    return result
+
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ _ALL
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+
+def _all(values: Iterable[Any]) -> bool | None:
+    """Returns whether all values are truthy, or None if empty"""
+
+    # Initialize result
+    result = None
+
+    # Iterate over values
+    for value in values:
+        # Return False if value is falsy
+        if not value:
+            return False
+
+        # Set result to True
+        result = True
+
+    # Return result
+    return result
+
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ _MEAN
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+
+def _mean(values: list[Any]) -> Any:
+    """Returns the mean of a list of values"""
+
+    # Return mean
+    return sum(values) / len(values)
+
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ REDUCERS BY KEY
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+# Initialize reducers by aggregate key as (reducer, streams, reverse) tuples, where
+# streaming reducers consume an iterable of values and return None if it is empty,
+# and non-streaming reducers are only called with a non-empty list of values
+_REDUCERS_BY_KEY: dict[str, tuple[Callable[[Any], Any], bool, bool]] = {
+    "first": (_first, True, False),
+    "last": (_first, True, True),
+    "sum": (sum, False, False),
+    "mean": (_mean, False, False),
+    "min": (_min, True, False),
+    "max": (_max, True, False),
+    "any": (_any, True, False),
+    "all": (_all, True, False),
+}
+
+
 # ┌─────────────────────────────────────────────────────────────────────────────────────
 # │ OAGG
 # └─────────────────────────────────────────────────────────────────────────────────────
@@ -34,80 +150,137 @@ def oagg(
     # Initialize instance kwargs
     instance_kwargs = kwargs or {}
 
-    # Iterate over the aggregate schema
-    for key, attrs in agg_schema.items():
+    # Get compiled reducers and unique attributes, raising a ValueError for invalid
+    # keys upfront
+    reducers, attrs_unique = _compile_agg_schema(
+        tuple((key, tuple(attrs)) for key, attrs in agg_schema.items())
+    )
+
+    # Initialize non-null values by attribute
+    values_by_attr: dict[str, list[Any]] = {attr: [] for attr in attrs_unique}
+
+    # Get attribute, values and path flag triples
+    collectors = [
+        (attr, values, "." in attr) for attr, values in values_by_attr.items()
+    ]
+
+    # Iterate over instances once for all attributes
+    for instance in instances:
+        # Check if instance is a dictionary
+        is_dict = isinstance(instance, dict)
+
+        # Iterate over collectors
+        for attr, values, is_path in collectors:
+            # Check if attribute is a path
+            if is_path:
+                # Get value by path
+                value = oget(instance, attr, default=None)
+
+            # Otherwise get value by key or attribute without an oget call
+            else:
+                value = (
+                    instance.get(attr)  # type: ignore[union-attr]
+                    if is_dict
+                    else getattr(instance, attr, None)
+                )
+
+            # Append if value is not None
+            if value is not None:
+                values.append(value)
+
+    # Iterate over reducers
+    for (reducer, streams, reverse), attrs in reducers:
         # Iterate over attributes
         for attr in attrs:
-            # Initialize values
-            values = []
+            # Get values
+            values = values_by_attr[attr]
 
-            # Iterate over instances
-            for instance in instances:
-                # Get value
-                value = oget(instance, attr, default=None)
+            # Check if reducer streams
+            if streams:
+                # Get value by reducer
+                value = reducer(reversed(values) if reverse else values)
 
-                # Append if value is not None
-                if value is not None:
-                    values.append(value)
+            # Otherwise get value by reducer, or None if values is empty
+            else:
+                value = reducer(values) if values else None
 
-            # Check if values is empty
-            if not values:
-                value = None
+            # Check if attribute is a path
+            if "." in attr:
+                # Add value to instance kwargs by path
+                dset(instance_kwargs, attr, value, insert=True)
 
-            # Otherwise check if key is first
-            elif key == "first":
-                value = values[0]
+            # Otherwise add value to instance kwargs by key
+            else:
+                instance_kwargs[attr] = value
 
-            # Otherwise check if key is last
-            elif key == "last":
-                value = values[-1]
+    # Return instance
+    return InstanceClass(**instance_kwargs)
 
-            # Otherwise check if key is sum
-            elif key == "sum":
-                value = sum(values)
 
-            # Otherwise check if key is mean
-            elif key == "mean":
-                value = sum(values) / len(values)
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ _COMPILE AGG SCHEMA
+# └─────────────────────────────────────────────────────────────────────────────────────
 
-            # Otherwise check if key is min
-            elif key == "min":
-                value = min(values)
 
-            # Otherwise check if key is max
-            elif key == "max":
-                value = max(values)
+@lru_cache(maxsize=256)
+def _compile_agg_schema(
+    items: tuple[tuple[str, tuple[str, ...]], ...]
+) -> tuple[
+    tuple[tuple[tuple[Callable[[Any], Any], bool, bool], tuple[str, ...]], ...],
+    tuple[str, ...],
+]:
+    """Compiles aggregate schema items into cached reducers and unique attributes"""
 
-            # Otherwise check if any
-            elif key == "any":
-                value = any(values)
+    # Get compiled reducers and attributes
+    reducers = tuple((_compile_reducer(key), attrs) for key, attrs in items)
 
-            # Otherwise check if all
-            elif key == "all":
-                value = all(values)
+    # Get unique attributes in schema order
+    attrs_unique = tuple(dict.fromkeys(attr for _, attrs in items for attr in attrs))
 
-            # Otherwise check if concat unique
-            elif key.startswith("concat-unique-"):
-                # Get separator
-                sep = key.split("concat-unique-")[1]
+    # Return compiled reducers and unique attributes
+    return reducers, attrs_unique
 
-                # Get unique values
-                value = sep.join(sorted(set(values)))
 
-            # Otherwise check if concat
-            elif key.startswith("concat-"):
-                # Get separator
-                sep = key.split("concat-")[1]
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ _COMPILE REDUCER
+# └─────────────────────────────────────────────────────────────────────────────────────
 
-                # Get unique values
-                value = sep.join(values)
 
-            # Otherwise raise error
-            else:
-                raise ValueError(f"Invalid aggregate key: {key}")
+def _compile_reducer(key: str) -> tuple[Callable[[Any], Any], bool, bool]:
+    """Compiles an aggregate key into a (reducer, streams, reverse) tuple"""
 
-            # Add value to instance kwargs
-            dset(instance_kwargs, attr, value, insert=True)
+    # Get reducer by key
+    reducer = _REDUCERS_BY_KEY.get(key)
 
-    # Return instance
-    return InstanceClass(**instance_kwargs)
+    # Return reducer if not None
+    if reducer is not None:
+        return reducer
+
+    # Check if concat unique
+    if key.startswith("concat-unique-"):
+        # Get separator
+        sep = key.removeprefix("concat-unique-")
+
+        # ┌─────────────────────────────────────────────────────────────────────────────
+        # │ CONCAT UNIQUE
+        # └─────────────────────────────────────────────────────────────────────────────
+
+        def concat_unique(values: Iterable[Any]) -> str | None:
+            """Joins sorted unique values by the separator, or None if empty"""
+
+            # Get unique values
+            unique = set(values)
+
+            # Return joined unique values
+            return sep.join(sorted(unique)) if unique else None
+
+        # Return reducer
+        return concat_unique, True, False
+
+    # Check if concat
+    if key.startswith("concat-"):
+        # Return separator join
+        return key.removeprefix("concat-").join, False, False
+
+    # Raise error
+    raise ValueError(f"Invalid aggregate key: {key}")
@@ -2,6 +2,9 @@
 # │ GENERAL IMPORTS
 # └─────────────────────────────────────────────────────────────────────────────────────
 
+import sys
+
+from functools import lru_cache
 from typing import Any
 
 # ┌─────────────────────────────────────────────────────────────────────────────────────
@@ -9,6 +12,27 @@ from typing import Any
 # └─────────────────────────────────────────────────────────────────────────────────────
 
 from core.placeholders import nothing
+from core.placeholders.classes.nothing import Nothing
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ MISSING
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+# Initialize a private missing placeholder
+_MISSING = Nothing()
+
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ _SPLIT PATH
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+
+@lru_cache(maxsize=4096)
+def _split_path(path: str, delimiter: str) -> tuple[str, ...]:
+    """Splits a path string into a cached tuple of interned keys"""
+
+    # Return interned keys
+    return tuple(sys.intern(key) for key in path.split(delimiter))
 
 
 # ┌─────────────────────────────────────────────────────────────────────────────────────
@@ -24,32 +48,68 @@ def oget(
 ) -> Any:
     """Gets a value from a nested object instance using a path string"""
 
+    # Check if path is a single key
+    if delimiter not in path:
+        # Check if dict
+        if isinstance(instance, dict):
+            # Get value by key
+            value = instance.get(path, _MISSING)
+
+            # Return value if key exists
+            if value is not _MISSING:
+                return value
+
+            # Return default if given, otherwise raise a KeyError
+            return default if default is not nothing else instance[path]
+
+        # Get value by attribute
+        value = getattr(instance, path, _MISSING)
+
+        # Return value if attribute exists
+        if value is not _MISSING:
+            return value
+
+        # Return default if given, otherwise raise an AttributeError
+        return default if default is not nothing else getattr(instance, path)
+
     # Initialize value
     value = default
 
     # Iterate over keys
-    for key in path.split(delimiter):
+    for key in _split_path(path, delimiter):
         # Check if dict
         if isinstance(instance, dict):
-            # Check if key exists or no default is given
-            if key in instance or default is nothing:
-                # Get value by key and set dictionary
-                value = instance = instance[key]
+            # Get value by key
+            value = instance.get(key, _MISSING)
+
+            # Check if key does not exist
+            if value is _MISSING:
+                # Return default if given
+                if default is not nothing:
+                    return default
+
+                # Get value by key, raising a KeyError
+                value = instance[key]
 
-            # Otherwise return default
-            else:
-                return default
+            # Set dictionary
+            instance = value
 
         # Otherwise handle object
         else:
-            # Check if attribute exists or no default is given
-            if hasattr(instance, key) or default is nothing:
-                # Get value by attribute and set instance
-                value = instance = getattr(instance, key)
-
-            # Otherwise return default
-            else:
-                return default
+            # Get value by attribute
+            value = getattr(instance, key, _MISSING)
+
+            # Check if attribute does not exist
+            if value is _MISSING:
+                # Return default if given
+                if default is not nothing:
+                    return default
+
+                # Get value by attribute, raising an AttributeError
+                value = getattr(instance, key)
+
+            # Set instance
+            instance = value
 
     # Return value
     return value
@@ -4,6 +4,12 @@
 
 from typing import Any
 
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ PROJECT IMPORTS
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+from core.object.functions.oget import _split_path
+
 
 # ┌─────────────────────────────────────────────────────────────────────────────────────
 # │ OHASATTR
@@ -15,8 +21,15 @@ def ohasattr(
 ) -> bool:
     """Returns a boolean of whether or not an object has an attribute"""
 
+    # Check if path is a single key
+    if delimiter not in path:
+        # Return whether key or attribute exists
+        return (
+            path in instance if isinstance(instance, dict) else hasattr(instance, path)
+        )
+
     # Iterate over keys
-    for key in path.split(delimiter):
+    for key in _split_path(path, delimiter):
         # Check if dict
         if isinstance(instance, dict):
             # Return if key does not exist
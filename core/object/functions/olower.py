@@ -18,6 +18,16 @@ def olower(instance: Any) -> Any:
         # Lowercase instance
         instance = instance.lower()
 
+    # Otherwise check if list
+    elif type(instance) is list:
+        # Lowercase each item in the list, inlining plain strings
+        instance = [i.lower() if type(i) is str else olower(i) for i in instance]
+
+    # Otherwise check if tuple
+    elif type(instance) is tuple:
+        # Lowercase each item in the tuple, inlining plain strings
+        instance = tuple([i.lower() if type(i) is str else olower(i) for i in instance])
+
     # Otherwise check if sequence
     elif isinstance(instance, (list, tuple)):
         # Lowercase each item in the instance
@@ -2,7 +2,14 @@
 # │ GENERAL IMPORTS
 # └─────────────────────────────────────────────────────────────────────────────────────
 
-from typing import Any
+from functools import lru_cache
+from typing import Any, Callable
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ PROJECT IMPORTS
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+from core.object.functions.oget import _split_path
 
 
 # ┌─────────────────────────────────────────────────────────────────────────────────────
@@ -19,62 +26,131 @@ def oset(
 ) -> None:
     """Sets a value in a nested dictionary using a path string"""
 
-    # Check if the path is a tuple
-    if isinstance(path, tuple):
-        # Check if the value to set is not a tuple or list
-        if not isinstance(value, (tuple, list)):
-            # Convert value to set to a list
-            value = [value] * len(path)
+    # Set value using the setter for the path type
+    _OSET_BY_TYPE.get(type(path), _oset_any)(instance, path, value, delimiter, insert)
 
-        # Iterate over zip of path and value to set
-        for path_i, value_i in zip(path, value):
-            # Remap data
-            oset(instance, path_i, value_i, insert=insert)
 
-    # Otherwise, handle case of string path
-    elif isinstance(path, str):
-        # Split the path into keys
-        keys = path.split(delimiter)
-
-        # Iterate over keys
-        for key in keys[:-1]:
-            # Check if dict
-            if isinstance(instance, dict):
-                # Check if key exists
-                if insert and key not in instance:
-                    # Set key to empty dictionary
-                    instance[key] = {}
-
-                # Get value by key
-                instance = instance[key]
-
-            # Otherwise handle object
-            else:
-                # Check if key exists
-                if insert and not hasattr(instance, key):
-                    # Set key to empty dictionary
-                    setattr(instance, key, {})
-
-                # Get value by key
-                instance = getattr(instance, key)
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ _OSET TUPLE
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+
+def _oset_tuple(
+    instance: object | dict[Any, Any],
+    path: tuple[Any, ...],
+    value: Any,
+    delimiter: str,
+    insert: bool,
+) -> None:
+    """Sets values in a nested dictionary using a tuple of paths"""
+
+    # Check if the value to set is not a tuple or list
+    if not isinstance(value, (tuple, list)):
+        # Convert value to set to a list
+        value = [value] * len(path)
+
+    # Iterate over zip of path and value to set
+    for path_i, value_i in zip(path, value):
+        # Set value using the setter for the path type
+        _OSET_BY_TYPE.get(type(path_i), _oset_any)(
+            instance, path_i, value_i, delimiter, insert
+        )
 
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ _OSET STR
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+
+def _oset_str(
+    instance: object | dict[Any, Any],
+    path: str,
+    value: Any,
+    delimiter: str,
+    insert: bool,
+) -> None:
+    """Sets a value in a nested dictionary using a delimited path string"""
+
+    # Split the path into leading keys and last key
+    keys, key_last = (
+        ((), path) if delimiter not in path else _split_path_last(path, delimiter)
+    )
+
+    # Iterate over leading keys
+    for key in keys:
         # Check if dict
         if isinstance(instance, dict):
-            # Check if insert is False
-            if not insert:
-                instance[keys[-1]]
-
-            # Set value by last key
-            instance[keys[-1]] = value
+            # Get value by key, inserting an empty dictionary if missing
+            instance = instance.setdefault(key, {}) if insert else instance[key]
 
         # Otherwise handle object
         else:
-            # Check if insert is False
-            if not insert:
-                getattr(instance, keys[-1])
+            # Check if key exists
+            if insert and not hasattr(instance, key):
+                # Set key to empty dictionary
+                setattr(instance, key, {})
+
+            # Get value by key
+            instance = getattr(instance, key)
+
+    # Check if dict
+    if isinstance(instance, dict):
+        # Check if insert is False
+        if not insert:
+            instance[key_last]
+
+        # Set value by last key
+        instance[key_last] = value
+
+    # Otherwise handle object
+    else:
+        # Check if insert is False
+        if not insert:
+            getattr(instance, key_last)
+
+        # Set value by last key
+        setattr(instance, key_last, value)
+
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ _SPLIT PATH LAST
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+
+@lru_cache(maxsize=4096)
+def _split_path_last(path: str, delimiter: str) -> tuple[tuple[str, ...], str]:
+    """Splits a path string into cached leading keys and a last key"""
+
+    # Split the path into keys
+    keys = _split_path(path, delimiter)
+
+    # Return leading keys and last key
+    return keys[:-1], keys[-1]
+
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ _OSET ANY
+# └─────────────────────────────────────────────────────────────────────────────────────
 
-            # Set value by last key
-            setattr(instance, keys[-1], value)
+
+def _oset_any(
+    instance: object | dict[Any, Any],
+    path: Any,
+    value: Any,
+    delimiter: str,
+    insert: bool,
+) -> None:
+    """Sets a value in a nested dictionary using a path of any other type"""
+
+    # Check if the path is a tuple subclass
+    if isinstance(path, tuple):
+        # Set values by tuple path
+        _oset_tuple(instance, path, value, delimiter, insert)
+
+    # Otherwise, handle case of string subclass path
+    elif isinstance(path, str):
+        # Set value by string path
+        _oset_str(instance, path, value, delimiter, insert)
 
     # Otherwise, handle general case
     else:
@@ -87,3 +163,14 @@ def oset(
         else:
             # Set value by path
             setattr(instance, path, value)
+
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ _OSET BY TYPE
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+# Define setters by exact path type
+_OSET_BY_TYPE: dict[type, Callable[[Any, Any, Any, str, bool], None]] = {
+    tuple: _oset_tuple,
+    str: _oset_str,
+}
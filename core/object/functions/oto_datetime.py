@@ -10,7 +10,31 @@ from typing import Any
 # └─────────────────────────────────────────────────────────────────────────────────────
 
 from core.datetime.functions.dtto_utc import dtto_utc
-from core.object.functions.olower import olower
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ DATETIME FORMATS
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+# Initialize common datetime formats in order of precedence
+_DATETIME_FORMATS = (
+    "%Y-%m-%d %H:%M:%S.%f%z",
+    "%Y-%m-%d %H:%M:%S.%f",
+    "%Y-%m-%d %H:%M:%S",
+    "%Y-%m-%d %H:%M",
+    "%Y-%m-%d %H",
+    "%Y-%m-%d",
+    "%Y-%m",
+    "%Y",
+)
+
+# Initialize zero-padded datetime formats by (length, colon count, dash count)
+_DATETIME_FORMAT_BY_SHAPE = {
+    (19, 2, 2): "%Y-%m-%d %H:%M:%S",
+    (16, 1, 2): "%Y-%m-%d %H:%M",
+    (13, 0, 2): "%Y-%m-%d %H",
+    (10, 0, 2): "%Y-%m-%d",
+    (7, 0, 1): "%Y-%m",
+}
 
 
 # ┌─────────────────────────────────────────────────────────────────────────────────────
@@ -24,53 +48,47 @@ def oto_datetime(instance: Any, unit: str = "ms", tz: tzinfo | None = None) -> d
     # Initialize datetime
     dt = None
 
+    # Convert digit strings to int
+    if isinstance(instance, str) and instance.isdigit():
+        instance = int(instance)
+
     # Check if instance is already a datetime
     if isinstance(instance, datetime):
         dt = instance
 
-    # Check if string
-    if isinstance(instance, str):
-        # Check if is digit
-        if instance.isdigit():
-            # Convert to int
-            instance = int(instance)
-
-    # Check if instance is int
-    if isinstance(instance, int) or isinstance(instance, float):
-        # Initialize seconds
-        seconds: float = float(instance)
+    # Otherwise check if instance is a number
+    elif isinstance(instance, (int, float)):
+        # Set datetime, converting milliseconds to seconds if unit is ms
+        dt = datetime.fromtimestamp(
+            instance / 1000.0 if unit.lower() == "ms" else float(instance)
+        )
 
-        # Get unit lower
-        unit_lower = olower(unit)
-
-        # Convert if unit is ms
-        if unit_lower == "ms":
-            # Convert to seconds
-            seconds = instance / 1000.0
-
-        # Set datetime
-        dt = datetime.fromtimestamp(seconds)
-
-    # Otherwise, check if instance is str
+    # Otherwise check if instance is str
     elif isinstance(instance, str):
-        # Iterate over common datetime formats
-        for fmt in [
-            "%Y-%m-%d %H:%M:%S.%f%z",
-            "%Y-%m-%d %H:%M:%S.%f",
-            "%Y-%m-%d %H:%M:%S",
-            "%Y-%m-%d %H:%M",
-            "%Y-%m-%d %H",
-            "%Y-%m-%d",
-            "%Y-%m",
-            "%Y",
-        ]:
+        # Get datetime format by shape
+        fmt = _DATETIME_FORMAT_BY_SHAPE.get(
+            (len(instance), instance.count(":"), instance.count("-"))
+        )
+
+        # Check if datetime format is not None
+        if fmt is not None:
             try:
                 # Set datetime
                 dt = datetime.strptime(instance, fmt)
-                break
             except ValueError:
                 dt = None
 
+        # Check if datetime is None
+        if dt is None:
+            # Iterate over common datetime formats
+            for fmt in _DATETIME_FORMATS:
+                try:
+                    # Set datetime
+                    dt = datetime.strptime(instance, fmt)
+                    break
+                except ValueError:
+                    dt = None
+
     # Check if datetime is None
     if dt is None:
         # Raise a TypeError
@@ -4,7 +4,7 @@
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
+from typing import Any, TYPE_CHECKING
 
 # ┌─────────────────────────────────────────────────────────────────────────────────────
 # │ PROJECT IMPORTS
@@ -34,8 +34,28 @@ def oupdate(
     # Initialize an unfound instance
     unfound = Nothing()
 
+    # Check if schema is empty
+    if not schema:
+        # Iterate over source attributes
+        for attr, new_value in instance_src.__dict__.items():
+            # Get new value by path if attribute contains the delimiter
+            if delimiter in attr:
+                new_value = oget(
+                    instance_src, path=attr, default=unfound, delimiter=delimiter
+                )
+
+                # Continue if new value is not found
+                if new_value is unfound:
+                    continue
+
+            # Update value
+            _oupdate_value(instance_dst, attr, new_value, delimiter, unfound)
+
+        # Return early
+        return
+
     # Iterate over the schema
-    for key in schema or instance_src.__dict__:
+    for key in schema:
         # Get keys
         keys = key if isinstance(key, (tuple, list)) else (key,)
 
@@ -50,20 +70,41 @@ def oupdate(
             if new_value is unfound:
                 continue
 
-            # Get old value
-            old_value = oget(
-                instance_dst, path=key, default=unfound, delimiter=delimiter
-            )
+            # Update value
+            _oupdate_value(instance_dst, key, new_value, delimiter, unfound)
 
-            # Continue if old value is not found
-            if old_value is unfound:
-                continue
 
-            # Set value
-            oset(
-                instance_dst,
-                path=key,
-                value=new_value,
-                delimiter=delimiter,
-                insert=False,
-            )
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ _OUPDATE VALUE
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+
+def _oupdate_value(
+    instance_dst: object, key: str, new_value: Any, delimiter: str, unfound: Any
+) -> None:
+    """Sets a new value on an instance if the key or attribute already exists"""
+
+    # Check if key is a single key
+    if delimiter not in key:
+        # Check if dict
+        if isinstance(instance_dst, dict):
+            # Set value if key exists
+            if key in instance_dst:
+                instance_dst[key] = new_value
+
+        # Otherwise set value if attribute exists
+        elif getattr(instance_dst, key, unfound) is not unfound:
+            setattr(instance_dst, key, new_value)
+
+        # Return early
+        return
+
+    # Get old value
+    old_value = oget(instance_dst, path=key, default=unfound, delimiter=delimiter)
+
+    # Return if old value is not found
+    if old_value is unfound:
+        return
+
+    # Set value
+    oset(instance_dst, path=key, value=new_value, delimiter=delimiter, insert=False)
@@ -0,0 +1,302 @@
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ GENERAL IMPORTS
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+from __future__ import annotations
+
+import copy
+import enum
+
+from collections import OrderedDict, defaultdict
+from types import SimpleNamespace
+from typing import Any
+
+import pytest
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ PROJECT IMPORTS
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+from core.dict.classes.dict_schema_context import DictSchemaContext
+from core.dict.functions import dcompile_schema, dfrom_schema
+from core.dict.types import DictSchema
+
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ REFERENCE DFROM SCHEMA
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+
+def reference_dfrom_schema(
+    data: Any, schema: Any, defaults: Any = None, delimiter: str = "."
+) -> Any:
+    """Remaps a dictionary the way dfrom_schema did before it was compiled"""
+
+    # Initialize mapped data
+    mapped_data = defaults or {}
+
+    # Iterate over schema
+    for setter, getter in (schema or {}).items():
+        # Get value to set
+        value = (
+            getter(DictSchemaContext(data=data, item=data))
+            if callable(getter)
+            else reference_get(data, getter, delimiter)
+        )
+
+        # Set value to mapped data
+        reference_set(mapped_data, setter, value, delimiter)
+
+    # Return mapped data
+    return mapped_data
+
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ REFERENCE GET
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+
+def reference_get(instance: Any, path: str, delimiter: str) -> Any:
+    """Gets a nested value the way oget did without a default"""
+
+    # Iterate over keys
+    for key in path.split(delimiter):
+        # Get value by key if dict, otherwise by attribute
+        instance = (
+            instance[key] if isinstance(instance, dict) else getattr(instance, key)
+        )
+
+    # Return value
+    return instance
+
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ REFERENCE SET
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+
+def reference_set(instance: Any, path: str, value: Any, delimiter: str) -> None:
+    """Sets a nested value the way oset did with insert"""
+
+    # Split the path into keys
+    keys = path.split(delimiter)
+
+    # Iterate over leading keys
+    for key in keys[:-1]:
+        # Check if dict
+        if isinstance(instance, dict):
+            # Insert an empty dictionary if missing
+            if key not in instance:
+                instance[key] = {}
+
+            # Get value by key
+            instance = instance[key]
+
+        # Otherwise handle object
+        else:
+            # Insert an empty dictionary if missing
+            if not hasattr(instance, key):
+                setattr(instance, key, {})
+
+            # Get value by attribute
+            instance = getattr(instance, key)
+
+    # Set value by last key if dict, otherwise by attribute
+    if isinstance(instance, dict):
+        instance[keys[-1]] = value
+    else:
+        setattr(instance, keys[-1], value)
+
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ HELPERS
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+
+class Key(str, enum.Enum):
+    """A str enum used as a schema key"""
+
+    A = "a"
+    X = "x"
+
+
+class Mapping:
+    """A non-dict with both an item and an attribute of the same name"""
+
+    x = "attribute"
+
+    def __getitem__(self, key: str) -> str:
+        """Get Item Method"""
+
+        # Return item
+        return "item"
+
+
+def copies(data: Any, schema: Any, defaults: Any) -> tuple[Any, Any, Any]:
+    """Returns copies of data and defaults, as remapping may mutate them"""
+
+    # Return copies of data and defaults with the same schema
+    return copy.deepcopy(data), schema, copy.deepcopy(defaults)
+
+
+def outcome(function: Any, *args: Any) -> Any:
+    """Returns the result of a call or the type of the exception it raises"""
+
+    # Initialize try-except block
+    try:
+        # Return result
+        return function(*args)
+
+    # Return exception type
+    except Exception as e:
+        return type(e)
+
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ CASES
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+# Define cases of data, schema and defaults
+CASES: list[tuple[Any, Any, Any]] = [
+    # Flat keys
+    ({"x": 1, "y": 2}, {"a": "x", "b": "y"}, None),
+    # Flat keys with a missing key
+    ({"x": 1}, {"a": "x", "b": "y"}, None),
+    # Flat keys with a None value
+    ({"x": None}, {"a": "x"}, None),
+    # Flat keys with a repeated setter
+    ({"x": 1, "y": 2}, {"a": "x", "b": "y", "c": "x"}, None),
+    # Nested getters
+    ({"x": {"y": {"z": 1}}, "w": 2}, {"a": "x.y.z", "b": "w", "c": "x.y"}, None),
+    # Nested getter with a missing leaf
+    ({"x": {"y": {}}}, {"a": "x.y.z"}, None),
+    # Nested setters
+    ({"x": 1, "y": 2}, {"a.b": "x", "a.c": "y", "d.e.f": "x"}, None),
+    # Nested setter overwriting a flat setter
+    ({"x": 1, "y": {"z": 2}}, {"a": "y", "a.b": "x"}, None),
+    # Defaults kept and extended
+    ({"x": 1}, {"a.b": "x", "c": "x"}, {"keep": 0, "a": {"z": 0}}),
+    # Defaults overwritten
+    ({"x": 1}, {"keep": "x"}, {"keep": 0}),
+    # Defaults with a non-dict intermediate
+    ({"x": 1}, {"a.b": "x"}, {"a": SimpleNamespace()}),
+    # Defaults with a dict subclass intermediate
+    ({"x": 1}, {"a.b.c": "x"}, {"a": OrderedDict()}),
+    # Callables
+    ({"x": 2, "y": 3}, {"a": lambda c: c.data["x"] * c.item["y"], "b": "y"}, None),
+    # Callable into a nested setter
+    ({"x": 2}, {"a.b": lambda c: c.data["x"]}, None),
+    # Object intermediate
+    ({"x": SimpleNamespace(y=1)}, {"a": "x.y"}, None),
+    # Object intermediate with a missing attribute
+    ({"x": SimpleNamespace()}, {"a": "x.y"}, None),
+    # List intermediate
+    ({"x": [1]}, {"a": "x.0"}, None),
+    # Default dict data that inserts missing keys
+    (defaultdict(int, y=1), {"a": "x", "b": "y"}, None),
+    # Dict subclass data and intermediates
+    (OrderedDict(x=OrderedDict(y=1), z=2), {"a": "x.y", "b": "z"}, None),
+    # Object data
+    (SimpleNamespace(x=1, y=SimpleNamespace(z=2)), {"a": "x", "b": "y.z"}, None),
+    # Non-dict mapping data read by attribute
+    (Mapping(), {"a": "x"}, None),
+    # Non-dict mapping intermediate read by attribute
+    ({"m": Mapping()}, {"a": "m.x"}, None),
+    # String enum keys
+    ({"x": 1}, {Key.A: Key.X}, None),
+    # Empty schema
+    ({"x": 1}, {}, {"keep": 0}),
+]
+
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ TEST DFROM SCHEMA
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+
+@pytest.mark.parametrize("data, schema, defaults", CASES)
+def test_dfrom_schema(data: Any, schema: Any, defaults: Any) -> None:
+    """Tests that dfrom_schema matches the reference implementation"""
+
+    # Get expected outcome using copies, as the reference mutates defaults
+    expected = outcome(reference_dfrom_schema, *copies(data, schema, defaults))
+
+    # Assert that dfrom_schema matches the reference
+    assert outcome(dfrom_schema, *copies(data, schema, defaults)) == expected
+
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ TEST DCOMPILE SCHEMA
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+
+@pytest.mark.parametrize("data, schema, defaults", CASES)
+def test_dcompile_schema(data: Any, schema: Any, defaults: Any) -> None:
+    """Tests that a compiled schema matches the reference implementation"""
+
+    # Compile schema
+    remap = dcompile_schema(schema)
+
+    # Iterate twice to reuse the compiled schema
+    for _ in range(2):
+        # Get copies of data and defaults
+        data_copy, _, defaults_copy = copies(data, schema, defaults)
+
+        # Get expected outcome
+        expected = outcome(reference_dfrom_schema, *copies(data, schema, defaults))
+
+        # Assert that the compiled schema matches the reference
+        assert outcome(remap, data_copy, defaults_copy) == expected
+
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ TEST DELIMITER
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+
+def test_delimiter() -> None:
+    """Tests that a custom delimiter splits paths and leaves dots as keys"""
+
+    # Initialize data
+    data: dict[str, Any] = {"x": {"y": 1}, "v.w": 2}
+
+    # Initialize schema
+    schema: DictSchema = {"a/b": "x/y", "c": "v.w"}
+
+    # Assert that dfrom_schema matches the reference
+    assert dfrom_schema(data, schema, delimiter="/") == reference_dfrom_schema(
+        data, schema, delimiter="/"
+    )
+
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ TEST DEFAULTS
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+
+def test_defaults() -> None:
+    """Tests that defaults are copied rather than filled in place"""
+
+    # Initialize defaults
+    defaults = {"keep": 0}
+
+    # Remap data
+    mapped_data = dfrom_schema({"x": 1}, {"a": "x"}, defaults=defaults)
+
+    # Assert that defaults are kept in the mapped data
+    assert mapped_data == {"keep": 0, "a": 1}
+
+    # Assert that defaults are unchanged
+    assert defaults == {"keep": 0}
+
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ TEST COMPILE CACHE
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+
+def test_compile_cache() -> None:
+    """Tests that equal string schemas share one compiled function"""
+
+    # Assert that equal schemas share a compiled function
+    assert dcompile_schema({"a": "x.y"}) is dcompile_schema({"a": "x.y"})
@@ -0,0 +1,82 @@
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ GENERAL IMPORTS
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+import pytest
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ PROJECT IMPORTS
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+from core.exceptions import (
+    InvalidArgumentError,
+    LabelException,
+    UnsuccessfulActionError,
+    UnsupportedError,
+)
+
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ TEST MESSAGE
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+
+@pytest.mark.parametrize(
+    "exception, expected",
+    [
+        (LabelException(), "Unknown"),
+        (UnsupportedError("x"), "Unsupported: x"),
+        (InvalidArgumentError("x"), "Invalid Argument: x"),
+        (InvalidArgumentError({"x": 1}), "Invalid Argument: {'x': 1}"),
+        (UnsuccessfulActionError(None), "Unsuccessful Action"),
+    ],
+)
+def test_message(exception: LabelException, expected: str) -> None:
+    """Tests that the message, str and args hold the formatted message"""
+
+    # Assert that the message is formatted
+    assert exception.message == expected
+
+    # Assert that str returns the formatted message
+    assert str(exception) == expected
+
+    # Assert that args hold the formatted message
+    assert exception.args == (expected,)
+
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ TEST REPR
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+
+def test_repr() -> None:
+    """Tests that the repr shows the formatted message"""
+
+    # Assert that repr shows the formatted message
+    assert (
+        repr(InvalidArgumentError({"x": 1}))
+        == "InvalidArgumentError(\"Invalid Argument: {'x': 1}\")"
+    )
+
+    # Assert that repr shows the formatted message of a None message
+    assert repr(UnsuccessfulActionError(None)) == (
+        "UnsuccessfulActionError('Unsuccessful Action')"
+    )
+
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ TEST MESSAGE ASSIGNMENT
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+
+def test_message_assignment() -> None:
+    """Tests that the message can be reassigned"""
+
+    # Initialize exception
+    exception = InvalidArgumentError("x")
+
+    # Reassign message
+    exception.message = "y"
+
+    # Assert that the message is reassigned
+    assert exception.message == "y"
@@ -0,0 +1,129 @@
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ GENERAL IMPORTS
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+from __future__ import annotations
+
+import json
+
+from types import SimpleNamespace
+from typing import Any
+
+import pytest
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ PROJECT IMPORTS
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+from core.client.functions import http_response_json as module
+from core.client.functions.http_response_json import (
+    http_response_json,
+    http_response_json_bytes,
+)
+
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ HELPERS
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+
+class Response:
+    """A response with raw content and a standard JSON parser"""
+
+    def __init__(self, content: bytes) -> None:
+        """Init Method"""
+
+        # Set content
+        self.content = content
+
+    def json(self) -> Any:
+        """Returns the JSON parsed by the standard parser"""
+
+        # Return JSON
+        return json.loads(self.content)
+
+
+def strict_loads(content: bytes) -> Any:
+    """Parses JSON like orjson, rejecting what it does not support"""
+
+    # Raise a ValueError for constants and integers wider than 64 bits
+    if b"NaN" in content or b"Infinity" in content or b"1" * 20 in content:
+        raise ValueError(content)
+
+    # Return JSON
+    return json.loads(content.decode("utf-8"))
+
+
+def reference_json(content: bytes) -> Any:
+    """Returns the JSON the standard parser returns, or None if invalid"""
+
+    # Initialize try-except block
+    try:
+        # Return JSON
+        return json.loads(content)
+
+    # Return None if invalid
+    except Exception:
+        return None
+
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ CASES
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+# Define cases of raw content
+CASES: list[bytes] = [
+    b'{"a": [1, 2.5, "x", null, true]}',
+    b'{"a": NaN, "b": Infinity, "c": -Infinity}',
+    b'{"a": ' + b"1" * 20 + b"}",
+    '{"a": "é"}'.encode("utf-16"),
+    b"",
+    b"<html></html>",
+]
+
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ FIXTURES
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+
+@pytest.fixture(params=["installed", "strict"])
+def orjson(request: pytest.FixtureRequest, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Runs a test with the installed orjson, if any, and with a strict parser"""
+
+    # Check if strict parser is requested
+    if request.param == "strict":
+        # Replace orjson with a strict parser
+        monkeypatch.setattr(module, "orjson", SimpleNamespace(loads=strict_loads))
+
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ TEST HTTP RESPONSE JSON BYTES
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+
+@pytest.mark.parametrize("content", CASES)
+def test_http_response_json_bytes(orjson: None, content: bytes) -> None:
+    """Tests that raw content parses like the standard parser"""
+
+    # Assert that the JSON matches the standard parser
+    assert repr(http_response_json_bytes(content)) == repr(reference_json(content))
+
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ TEST HTTP RESPONSE JSON
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+
+@pytest.mark.parametrize("content", CASES)
+def test_http_response_json(orjson: None, content: bytes) -> None:
+    """Tests that a response parses like its own parser and like raw content"""
+
+    # Get JSON
+    response_json = http_response_json(Response(content))
+
+    # Assert that the JSON matches the standard parser
+    assert repr(response_json) == repr(reference_json(content))
+
+    # Assert that the JSON matches the raw content parser
+    assert repr(response_json) == repr(http_response_json_bytes(content))
@@ -0,0 +1,243 @@
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ GENERAL IMPORTS
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+from __future__ import annotations
+
+import gc
+import logging
+import sys
+import time
+import uuid
+
+from datetime import datetime, timezone
+from pathlib import Path
+
+import pytest
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ PROJECT IMPORTS
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+from core.log.classes import logger as module
+from core.log.classes.logger import Logger
+from core.log.exceptions import InvalidLogFormatError
+
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ FIXTURES
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+
+@pytest.fixture
+def key() -> str:
+    """Returns a logger key that is not shared with other tests"""
+
+    # Return key
+    return f"test-{uuid.uuid4().hex}"
+
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ HELPERS
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+
+def freeze(monkeypatch: pytest.MonkeyPatch, created: float) -> None:
+    """Makes the logger and the stdlib log records use the same creation time"""
+
+    # Get timestamp
+    timestamp = datetime.fromtimestamp(created, timezone.utc)
+
+    # Replace the logger timestamp
+    monkeypatch.setattr(module, "dtnow_utc", lambda: timestamp)
+
+    # Replace the stdlib log record clocks
+    monkeypatch.setattr(time, "time", lambda: created)
+    monkeypatch.setattr(time, "time_ns", lambda: round(created * 1e6) * 1000)
+
+
+def stdlib_line(key: str, level: int, message: str) -> str:
+    """Returns a line written by a stdlib handler with the default log format"""
+
+    # Initialize log record
+    record = logging.LogRecord(key, level, __file__, 0, message, None, None)
+
+    # Return formatted line
+    return logging.Formatter(module._LOG_FORMAT_DEFAULT).format(record) + "\n"
+
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ TEST FAST LINE
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+
+@pytest.mark.parametrize("fast", [True, False])
+@pytest.mark.parametrize("level", [logging.WARNING, logging.ERROR, logging.CRITICAL])
+@pytest.mark.parametrize("created", [1700000000.0, 1700000000.123456, 1700000000.5])
+def test_line(
+    monkeypatch: pytest.MonkeyPatch,
+    capsys: pytest.CaptureFixture[str],
+    key: str,
+    fast: bool,
+    level: int,
+    created: float,
+) -> None:
+    """Tests that a log line matches the stdlib formatter byte for byte"""
+
+    # Freeze creation time
+    freeze(monkeypatch, created)
+
+    # Log message
+    Logger(key, fast=fast).log("a | b", level=level)
+
+    # Assert that the line matches the stdlib line
+    assert capsys.readouterr().err == stdlib_line(key, level, "a | b")
+
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ TEST FAST LEVELS
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+
+@pytest.mark.parametrize("log_level", [None, logging.ERROR])
+def test_levels(
+    capsys: pytest.CaptureFixture[str], key: str, log_level: int | None
+) -> None:
+    """Tests that a fast logger writes the same levels as a stdlib logger"""
+
+    # Iterate over fast and stdlib loggers
+    for fast in (True, False):
+        # Initialize logger
+        logger = Logger(f"{key}-{fast}", log_level=log_level, fast=fast)
+
+        # Iterate over levels
+        for level in (logging.DEBUG, logging.INFO, logging.WARNING, logging.ERROR):
+            # Log level name
+            logger.log(logging.getLevelName(level), level=level)
+
+    # Get lines of fast and stdlib loggers
+    lines = capsys.readouterr().err.splitlines()
+
+    # Get messages of fast and stdlib loggers
+    messages_fast = [line.rsplit(" | ", 1)[1] for line in lines if "-True" in line]
+    messages = [line.rsplit(" | ", 1)[1] for line in lines if "-False" in line]
+
+    # Assert that both loggers write the same messages
+    assert messages_fast == messages
+
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ TEST FAST CLOSE
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+
+def test_close(capsys: pytest.CaptureFixture[str], tmp_path: Path, key: str) -> None:
+    """Tests that close closes log files but not the standard streams"""
+
+    # Initialize logger
+    logger = Logger(key, fast=True)
+
+    # Add log file
+    logger.add_log_file(str(tmp_path / "log.txt"))
+
+    # Get log file
+    (file,) = logger._fast_files
+
+    # Log message
+    logger.error("a")
+
+    # Close logger
+    logger.close()
+
+    # Assert that the log file is closed
+    assert file.closed
+
+    # Assert that stderr and stdout are not closed
+    assert not sys.stderr.closed and not sys.stdout.closed
+
+    # Log message after close
+    logger.error("b")
+
+    # Assert that stderr keeps receiving messages
+    assert [line[-1] for line in capsys.readouterr().err.splitlines()] == ["a", "b"]
+
+    # Assert that the log file only received the message before close
+    assert (tmp_path / "log.txt").read_text().splitlines()[-1].endswith("| a")
+
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ TEST FAST GARBAGE COLLECTION
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+
+def test_garbage_collection(
+    capsys: pytest.CaptureFixture[str], tmp_path: Path, key: str
+) -> None:
+    """Tests that log files of a collected fast logger are closed"""
+
+    # Initialize logger
+    logger = Logger(key, fast=True)
+
+    # Add log file
+    logger.add_log_file(str(tmp_path / "log.txt"))
+
+    # Get log file
+    (file,) = logger._fast_files
+
+    # Delete logger and collect garbage
+    del logger
+    gc.collect()
+
+    # Assert that the log file is closed
+    assert file.closed
+
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ TEST FAST LOG FORMAT
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+
+def test_log_format(tmp_path: Path, key: str) -> None:
+    """Tests that a fast logger rejects custom log formats"""
+
+    # Assert that a fast logger rejects a log format
+    with pytest.raises(InvalidLogFormatError):
+        Logger(key, log_format="%(message)s", fast=True)
+
+    # Assert that a fast log file rejects a log format
+    with pytest.raises(InvalidLogFormatError):
+        Logger(key, fast=True).add_log_file(
+            str(tmp_path / "log.txt"), log_format="%(message)s"
+        )
+
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ TEST LOGS BY KEY
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+
+def test_logs_by_key(key: str) -> None:
+    """Tests that logs are stored by key within the log limits"""
+
+    # Initialize logger
+    logger = Logger(key, log_limit=2)
+
+    # Update log limit of a key before its first log
+    logger.update_log_limit_by_key("b", 3)
+
+    # Iterate over messages
+    for i in range(5):
+        # Log message with and without keys
+        logger.warning(f"none-{i}")
+        logger.warning(f"a-{i}", key="a")
+        logger.warning(f"b-{i}", key="b")
+
+    # Assert that each key keeps its latest messages within its limit
+    assert {
+        logs_key: [log.message for log in logs]
+        for logs_key, logs in logger._logs_by_key.items()
+    } == {
+        None: ["none-3", "none-4"],
+        "a": ["a-3", "a-4"],
+        "b": ["b-2", "b-3", "b-4"],
+    }
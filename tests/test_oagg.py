@@ -0,0 +1,242 @@
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ GENERAL IMPORTS
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+from __future__ import annotations
+
+import copy
+
+from types import SimpleNamespace
+from typing import Any, Iterable
+
+import pytest
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ PROJECT IMPORTS
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+from core.object.functions import oagg
+
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ REFERENCE OAGG
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+
+def reference_oagg(
+    instances: list[Any], agg_schema: dict[str, Iterable[str]], kwargs: Any = None
+) -> dict[str, Any]:
+    """Aggregates instances the way oagg did before it collected values in one pass"""
+
+    # Initialize instance kwargs
+    instance_kwargs = kwargs or {}
+
+    # Iterate over the aggregate schema
+    for key, attrs in agg_schema.items():
+        # Iterate over attributes
+        for attr in attrs:
+            # Get non-null values
+            values = [
+                value
+                for value in (reference_get(instance, attr) for instance in instances)
+                if value is not None
+            ]
+
+            # Get value by key, or None if values is empty
+            value = reference_reduce(key, values) if values else None
+
+            # Add value to instance kwargs
+            reference_set(instance_kwargs, attr, value)
+
+    # Return instance kwargs
+    return instance_kwargs
+
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ REFERENCE REDUCE
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+
+def reference_reduce(key: str, values: list[Any]) -> Any:
+    """Reduces a non-empty list of values the way oagg did by aggregate key"""
+
+    # Initialize reducers by key
+    reducers = {
+        "first": lambda: values[0],
+        "last": lambda: values[-1],
+        "sum": lambda: sum(values),
+        "mean": lambda: sum(values) / len(values),
+        "min": lambda: min(values),
+        "max": lambda: max(values),
+        "any": lambda: any(values),
+        "all": lambda: all(values),
+    }
+
+    # Return value if key has a reducer
+    if key in reducers:
+        return reducers[key]()
+
+    # Return joined sorted unique values if concat unique
+    if key.startswith("concat-unique-"):
+        return key.split("concat-unique-")[1].join(sorted(set(values)))
+
+    # Return joined values if concat
+    if key.startswith("concat-"):
+        return key.split("concat-")[1].join(values)
+
+    # Raise error
+    raise ValueError(f"Invalid aggregate key: {key}")
+
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ REFERENCE GET
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+
+def reference_get(instance: Any, path: str) -> Any:
+    """Gets a nested value the way oget did with a None default"""
+
+    # Iterate over keys
+    for key in path.split("."):
+        # Return None if key or attribute is missing
+        if not (
+            key in instance if isinstance(instance, dict) else hasattr(instance, key)
+        ):
+            return None
+
+        # Get value by key if dict, otherwise by attribute
+        instance = (
+            instance[key] if isinstance(instance, dict) else getattr(instance, key)
+        )
+
+    # Return value
+    return instance
+
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ REFERENCE SET
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+
+def reference_set(instance: dict[str, Any], path: str, value: Any) -> None:
+    """Sets a nested dictionary value the way dset did with insert"""
+
+    # Split the path into keys
+    *keys, key_last = path.split(".")
+
+    # Iterate over leading keys
+    for key in keys:
+        # Insert an empty dictionary if missing and get value by key
+        instance = instance.setdefault(key, {})
+
+    # Set value by last key
+    instance[key_last] = value
+
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ HELPERS
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+
+def outcome(function: Any, *args: Any) -> Any:
+    """Returns the result of a call or the type of the exception it raises"""
+
+    # Initialize try-except block
+    try:
+        # Return result
+        return function(*args)
+
+    # Return exception type
+    except Exception as e:
+        return type(e)
+
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ CASES
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+# Define instances of dictionaries, objects and nested values with gaps
+INSTANCES: list[Any] = [
+    {"n": 3, "b": 0, "s": "y", "x": {"y": 2.5}},
+    SimpleNamespace(n=1, b=1, s="x", x=SimpleNamespace(y=1)),
+    {"n": None, "b": None, "s": None, "x": None},
+    {"n": 2, "b": "", "s": "y", "x": {}},
+    SimpleNamespace(),
+    {"n": 5, "b": True, "s": "z", "x": {"y": -1}},
+]
+
+# Define cases of instances and aggregate schemas
+CASES: list[tuple[list[Any], dict[str, Iterable[str]]]] = [
+    # Every key over keys and a path
+    (
+        INSTANCES,
+        {
+            "first": ["n", "s"],
+            "last": ["x.y"],
+            "sum": ["n"],
+            "mean": ["x.y"],
+            "min": ["s"],
+            "max": ["n"],
+            "any": ["b"],
+            "all": ["x.y"],
+            "concat-, ": ["s"],
+            "concat-unique-|": ["s"],
+        },
+    ),
+    # Every key over one attribute, where later keys overwrite earlier ones
+    (INSTANCES, {key: ["n"] for key in ("first", "last", "min", "max", "sum")}),
+    # Truthiness keys over falsy values
+    (INSTANCES, {"any": ["b"], "all": ["b"]}),
+    # Every key over no values
+    (
+        INSTANCES,
+        {
+            key: ["missing", "x.missing"]
+            for key in ("first", "last", "sum", "mean", "min", "max", "any", "all")
+        },
+    ),
+    # Concat keys over no values
+    (INSTANCES, {"concat-,": ["missing"], "concat-unique-,": ["missing"]}),
+    # No instances
+    ([], {"first": ["n"], "mean": ["n"], "concat-unique-,": ["s"]}),
+    # Invalid key over values
+    (INSTANCES, {"first": ["n"], "median": ["n"]}),
+    # Empty schema
+    (INSTANCES, {}),
+]
+
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ TEST OAGG
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+
+@pytest.mark.parametrize("kwargs", [None, {"keep": 0, "x": {"z": 0}}])
+@pytest.mark.parametrize("instances, agg_schema", CASES)
+def test_oagg(
+    instances: list[Any], agg_schema: dict[str, Iterable[str]], kwargs: Any
+) -> None:
+    """Tests that oagg matches the reference implementation"""
+
+    # Get expected outcome
+    expected = outcome(reference_oagg, instances, agg_schema, copy.deepcopy(kwargs))
+
+    # Assert that oagg matches the reference
+    assert outcome(oagg, dict, instances, agg_schema, copy.deepcopy(kwargs)) == expected
+
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ TEST ITERATOR
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+
+def test_iterator() -> None:
+    """Tests that instances are consumed in a single pass for every attribute"""
+
+    # Get aggregate schema
+    agg_schema = CASES[0][1]
+
+    # Assert that an iterator of instances aggregates like a list
+    assert oagg(dict, iter(INSTANCES), agg_schema) == reference_oagg(
+        INSTANCES, agg_schema
+    )